@@ -0,0 +1,96 @@
+import gc
+import json
+import os
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # no cover
+    # python 2 has no tracemalloc, only wall time is measured there
+    tracemalloc = None
+
+BASELINES = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                         "baselines.json")
+
+# How much slower (or bigger) than its baseline a benchmark may get
+TOLERANCE = float(os.environ.get("BENCHMARK_TOLERANCE", "1.5"))
+
+# Set BENCHMARK_SAVE=1 to record the results as the new baselines
+SAVE = os.environ.get("BENCHMARK_SAVE", "") not in ("", "0")
+
+
+def measure(func, repeat=1, setup=None):
+    """Runs func repeat times, once for its wall time and once more for its
+    peak memory, since tracing allocations slows it down.
+    :param func: The function to measure, called without arguments.
+    :type func: func
+    :param repeat: How many times to call func.
+    :type repeat: int
+    :param setup: Called before each of the two runs, e.g. to reset caches,
+        so that both start from the same state.
+    :type setup: func
+    :returns: A dict with the mean wall time in seconds of one call, and
+        the peak memory allocated during all calls, in KiB (or None).
+    """
+
+    def prepare():
+        if setup is not None:
+            setup()
+        gc.collect()
+
+    def run():
+        for _ in range(repeat):
+            func()
+
+    prepare()
+    start = timeit.default_timer()
+    run()
+    seconds = (timeit.default_timer() - start) / repeat
+    peak_kib = None
+    if tracemalloc:
+        prepare()
+        tracemalloc.start()
+        run()
+        peak_kib = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    return {"seconds": round(seconds, 6), "peak_kib": peak_kib}
+
+
+def load_baselines():
+    if not os.path.exists(BASELINES):
+        return {}
+    with open(BASELINES, "r") as fs:
+        return json.load(fs)
+
+
+def save_baseline(name, result):
+    baselines = load_baselines()
+    baselines[name] = result
+    with open(BASELINES, "w") as fs:
+        json.dump(baselines, fs, indent=2, sort_keys=True)
+        fs.write("\n")
+
+
+def check_baseline(name, result):
+    """Compares result against the stored baseline of the benchmark name.
+    Benchmarks without a baseline pass, so that new ones can be added before
+    their baseline is recorded with BENCHMARK_SAVE=1.
+    :returns: A list of regression messages, empty if there are none.
+    """
+    if SAVE:
+        save_baseline(name, result)
+        return []
+    baseline = load_baselines().get(name)
+    if baseline is None:
+        return []
+    regressions = []
+    for metric in ("seconds", "peak_kib"):
+        if result[metric] is None or baseline.get(metric) is None:
+            continue
+        # Ignore noise on measurements too small to be meaningful
+        floor = 0.001 if metric == "seconds" else 64
+        limit = max(baseline[metric], floor) * TOLERANCE
+        if result[metric] > limit:
+            regressions.append("{0}: {1} {2} > {3} (baseline {4})".format(
+                name, metric, result[metric], limit, baseline[metric]))
+    return regressions
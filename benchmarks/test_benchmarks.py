@@ -0,0 +1,170 @@
+"""
+End to end registration and serving benchmarks.
+
+Running:
+
+  pytest benchmarks
+
+Each benchmark is compared against benchmarks/baselines.json, allowing
+BENCHMARK_TOLERANCE (default 1.5) times its baseline wall time and peak
+memory. Record new baselines with:
+
+  BENCHMARK_SAVE=1 pytest benchmarks
+"""
+import pytest
+from flask import Flask
+from flask_restful import Api, Resource, fields
+
+from flask_restful_swagger import Registry, swagger
+from .lib.helpers import check_baseline, measure
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+SIZES = [10, 100, 1000, 5000]
+
+# Serving benchmarks don't depend much on the number of requests, only on the
+# size of the api
+REQUESTS = 50
+
+
+def reset_caches():
+    # The module level caches would otherwise be warmed by whichever
+    # benchmark runs first, so every measurement starts without them
+    swagger._path_cache.clear()
+    swagger._operation_templates.clear()
+    swagger._swagger_type_cache.clear()
+    swagger._model_arguments_cache.clear()
+    # The UI templates are compiled once per process, by the first docs()
+    # (or warm_up); every measurement starts with them compiled
+    swagger.compile_templates()
+
+
+def make_resource(index):
+    @swagger.operation(
+        notes="Operation {0}".format(index),
+        nickname="get{0}".format(index),
+        parameters=[
+            {
+                "name": "item_id",
+                "description": "The item to fetch",
+                "required": True,
+                "allowMultiple": False,
+                "dataType": "integer",
+                "paramType": "path",
+            },
+        ],
+    )
+    def get(self, item_id):
+        """Fetches an item.
+        With a longer description
+        on several lines.
+        """
+        return "OK"
+
+    def post(self, item_id):
+        return "OK"
+
+    return type(
+        "Resource{0}".format(index),
+        (Resource,),
+        {"__doc__": "Resource number {0}".format(index), "get": get,
+         "post": post},
+    )
+
+
+def make_model(index):
+    return type(
+        "Model{0}".format(index),
+        (object,),
+        {
+            "__doc__": "Model number {0}".format(index),
+            "resource_fields": {
+                "id": fields.Integer,
+                "name": fields.String,
+                "price": fields.Float,
+                "created": fields.DateTime,
+                "tags": fields.List(fields.String),
+            },
+            "required": ["id"],
+        },
+    )
+
+
+def make_app(size, **kwargs):
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), **kwargs)
+    for index, resource in enumerate(make_resource(i) for i in range(size)):
+        api.add_resource(resource, "/items{0}/<int:item_id>".format(index))
+    return app
+
+
+def assert_no_regression(name, result):
+    regressions = check_baseline(name, result)
+    assert not regressions, "\n".join(regressions)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_benchmark_docs_add_resource(size):
+    resources = [make_resource(i) for i in range(size)]
+
+    def register():
+        app = Flask(__name__)
+        api = swagger.docs(Api(app))
+        for index, resource in enumerate(resources):
+            api.add_resource(resource, "/items{0}/<int:item_id>".format(index))
+
+    result = measure(register, setup=reset_caches)
+    assert_no_regression("docs_add_resource[{0}]".format(size), result)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_benchmark_add_model(size):
+    models = [make_model(i) for i in range(size)]
+
+    def register():
+        with patch("flask_restful_swagger.swagger.registry",
+                   Registry(models={})):
+            for model_class in models:
+                swagger.add_model(model_class)
+
+    result = measure(register, setup=reset_caches)
+    assert_no_regression("add_model[{0}]".format(size), result)
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("options", [{}, {"cache_spec": True}],
+                         ids=["default", "cache_spec"])
+def test_benchmark_swagger_registry_get(size, options):
+    app = make_app(size, **options)
+    client = app.test_client()
+    assert client.get("/api/spec.json").status_code == 200
+
+    result = measure(lambda: client.get("/api/spec.json"), repeat=REQUESTS)
+    assert_no_regression(
+        "swagger_registry_get[{0}-{1}]".format(
+            size, "-".join(sorted(options)) or "default"),
+        result,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("options", [{}, {"static_max_age": 3600}],
+                         ids=["default", "static_max_age"])
+def test_benchmark_static_files_get(size, options):
+    app = make_app(size, **options)
+    client = app.test_client()
+    url = "/api/spec/_/static/lib/swagger.js"
+    assert client.get(url).status_code == 200
+
+    def get():
+        client.get(url).close()
+
+    result = measure(get, repeat=REQUESTS)
+    assert_no_regression(
+        "static_files_get[{0}-{1}]".format(
+            size, "-".join(sorted(options)) or "default"),
+        result,
+    )
@@ -1,3 +1,101 @@
-registry = {"models": {}}
+import itertools
+import threading
+from collections import OrderedDict, deque
 
-api_spec_static = ""
+# Generations are drawn from one clock shared by every Registry, so that the
+# changes of an app's registry and of the models can be put in order
+_generations = itertools.count(1)
+
+
+class LRUCache(OrderedDict):
+    """
+    A dict holding at most maxsize entries, which drops the least recently
+    used entry to make room for a new one.
+    """
+
+    def __init__(self, maxsize=1024):
+        super(LRUCache, self).__init__()
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key not in self:
+                return default
+            # Move the entry to the end, the most recently used one
+            value = self.pop(key)
+            OrderedDict.__setitem__(self, key, value)
+            return value
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            if key in self:
+                self.pop(key)
+            elif len(self) >= self.maxsize:
+                self.popitem(last=False)
+            OrderedDict.__setitem__(self, key, value)
+
+
+class Registry(dict):
+    """
+    Maps the name of each documented blueprint ("app" for an Api bound to
+    the application) to its spec.
+
+    Specs of an Api bound to a Flask app live in a Registry of their own, in
+    app.extensions["flask-restful-swagger"], and go away with the app. The
+    module level registry below holds the specs of blueprints and of apis
+    that weren't bound to an app when documented, plus the "models", which
+    are shared by all apps.
+
+    Published entries are never modified: writers hold the lock, copy the
+    entry they change and publish the copy, which starts a new generation.
+    Readers don't take the lock and always see complete entries.
+
+    The last changes of endpoints and models are kept in a bounded log, as
+    (generation, entry name, change) tuples.
+    """
+
+    change_log_size = 1024
+
+    def __init__(self, *args, **kwargs):
+        super(Registry, self).__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+        self.generation = 0
+        # Options passed to swagger.docs, which must not leak into the spec
+        self.settings = {}
+        # Resources added to lazy apis, built on the first doc request
+        self.pending = []
+        # Encoded documents and rendered pages, keyed by the generation they
+        # were built from
+        self.cache = LRUCache()
+        # Path and tag indexes of the endpoints of each entry, published
+        # along with it
+        self.indexes = {}
+        # The resource registration documenting each swagger path of each
+        # entry, served by the help route
+        self.help = {}
+        self.changes = deque(maxlen=self.change_log_size)
+        # The generation of the last change dropped from the log
+        self.forgotten = 0
+
+    def publish(self, name, entry, changes=(), index=None):
+        with self.lock:
+            # The index of the entry is swapped in along with it
+            if index is not None:
+                self.indexes[name] = index
+            self[name] = entry
+            self.generation = next(_generations)
+            self.cache.clear()
+            for change in changes:
+                if len(self.changes) == self.changes.maxlen:
+                    self.forgotten = self.changes[0][0]
+                self.changes.append((self.generation, name, change))
+
+    def update_entry(self, name, **fields):
+        with self.lock:
+            entry = dict(self.get(name, {}))
+            entry.update(fields)
+            self.publish(name, entry)
+
+
+registry = Registry(models={})
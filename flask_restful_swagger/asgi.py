@@ -0,0 +1,103 @@
+"""
+An ASGI app serving the docs of a Flask app from memory.
+
+The specs, resource listings, help pages and static UI files documented by
+swagger.docs are rendered once through the Flask app, then served without
+going through it. Mount it in front of the Flask app (run through a WSGI
+bridge), which gets every other request:
+
+    from flask_restful_swagger.asgi import SwaggerDocsApp
+
+    application = SwaggerDocsApp(app, WsgiToAsgi(app))
+"""
+import asyncio
+
+from flask_restful_swagger.export import DocumentCache
+
+
+class SwaggerDocsApp(object):
+    """
+    Answers the requests for the documents of flask_app, and passes any
+    other request to app, the ASGI app it is mounted in front of (a 404,
+    or a closed websocket, when there is none).
+
+    Documents held in memory are answered from the event loop. Rendering one
+    runs the Flask app, so it is done in the default executor of the loop.
+    """
+
+    def __init__(self, flask_app, app=None, maxsize=1024):
+        self.documents = DocumentCache(flask_app, maxsize)
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            request = self._request(scope)
+            if request is not None:
+                known, document = self.documents.cached(*request)
+                if not known:
+                    loop = asyncio.get_event_loop()
+                    document = await loop.run_in_executor(
+                        None, self.documents.respond, *request)
+                if document is not None:
+                    await self._send(send, document,
+                                     scope["method"] == "HEAD")
+                    return
+        if self.app is not None:
+            await self.app(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._send(send, ("404 NOT FOUND", [], b""))
+        elif scope["type"] == "websocket":
+            # Closing before accepting rejects the handshake
+            await receive()
+            await send({"type": "websocket.close", "code": 1000})
+
+    def _request(self, scope):
+        # (path, base_url, query_string, headers) of a request that may be
+        # for one of the documents
+        root_path = scope.get("root_path", "")
+        path = scope["path"]
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        if not self.documents.serves(path):
+            return None
+        headers = dict(
+            (name.decode("latin-1").lower(), value.decode("latin-1"))
+            for name, value in scope.get("headers", [])
+        )
+        host = headers.get("host")
+        if host is None:
+            server = scope.get("server") or ("localhost", None)
+            host = server[0] if server[1] is None else "{0}:{1}".format(
+                *server)
+        base_url = "{0}://{1}{2}".format(
+            scope.get("scheme", "http"), host, root_path)
+        query_string = scope.get("query_string", b"").decode("latin-1")
+        return path, base_url, query_string, headers
+
+    @staticmethod
+    async def _send(send, document, head=False):
+        status, headers, body = document
+        await send({
+            "type": "http.response.start",
+            "status": int(status.split(" ", 1)[0]),
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": b"" if head else body,
+        })
+
+    @staticmethod
+    async def _lifespan(receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,23 @@
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from flask_restful_swagger.export import export_docs
+
+swagger = AppGroup("swagger", help="Swagger documentation commands.")
+
+
+@swagger.command("export")
+@click.argument("directory", type=click.Path(file_okay=False))
+@click.option(
+    "--base-url",
+    default="http://localhost",
+    show_default=True,
+    help="The url the documents will be served from.",
+)
+def export_command(directory, base_url):
+    """Writes the swagger spec, help pages and UI into DIRECTORY."""
+    written = export_docs(current_app._get_current_object(), directory,
+                          base_url)
+    click.echo("Exported {0} documents to {1}".format(len(written),
+                                                      directory))
@@ -0,0 +1,293 @@
+import errno
+import json
+import os
+import re
+import threading
+
+from werkzeug.http import is_resource_modified
+
+from flask_restful_swagger import LRUCache, registry
+from flask_restful_swagger.swagger import (
+    EXTENSION_NAME,
+    _walk_static_files,
+    build_pending,
+)
+
+
+def _app_specs(app):
+    # (registry, name) of the specs served by app: the ones in its own
+    # registry, and the ones of blueprints (or of apis not bound to an app)
+    # in the module level one
+    app_registry = app.extensions.get(EXTENSION_NAME, {})
+    for name in sorted(app_registry):
+        yield app_registry, name
+    for name in sorted(registry):
+        if name == "models" or name in app_registry:
+            continue
+        if name in app.blueprints or (name == "app" and
+                                      "app/registry" in app.view_functions):
+            yield registry, name
+
+
+def _spec_url(spec):
+    prefix = (spec.get("x-api-prefix", "") or "").rstrip("/")
+    return prefix + spec["spec_endpoint_path"]
+
+
+def document_urls(app):
+    """Lists the url of every document served by the docs of app.
+    :param app: The Flask app, after all of its resources were added.
+    :type app: Flask
+    :returns: A list of url paths, relative to the root of app.
+    """
+    static_files = sorted(path for path, _ in _walk_static_files())
+
+    urls = []
+    for spec_registry, name in _app_specs(app):
+        build_pending(spec_registry)
+        spec = spec_registry[name]
+        prefix = (spec.get("x-api-prefix", "") or "").rstrip("/")
+        spec_url = _spec_url(spec)
+        urls.extend([
+            spec_url + ".json",
+            spec_url + ".html",
+            spec_url + "/_/resource_list.json",
+        ])
+        urls.extend(spec_url + "/_/static/" + f for f in static_files)
+        if spec_registry.settings.get(name, {}).get("split_resources"):
+            index = spec_registry.indexes.get(name)
+            urls.extend(spec_url + "/_/resources/" + (group or "_")
+                        for group in (index.group_names() if index else []))
+        if not spec_registry.settings.get(name, {}).get("help_routes"):
+            continue
+        for api in spec.get("apis", []):
+            urls.extend([
+                prefix + api["path"] + ".help.json",
+                prefix + api["path"] + ".help.html",
+            ])
+    return urls
+
+
+def iter_documents(app, base_url="http://localhost"):
+    """Renders every document served by the docs of app.
+    The documents are rendered through the app itself, so they are exactly
+    what it would serve at base_url.
+    :param app: The Flask app, after all of its resources were added.
+    :type app: Flask
+    :param base_url: The url the documents will be served from.
+    :type base_url: string
+    :returns: An iterator of (url path, response) pairs.
+    """
+    client = app.test_client()
+    for url in document_urls(app):
+        yield url, client.get(url, base_url=base_url)
+
+
+# The resource listing url the UI page is rendered with
+_ui_listing_url = re.compile(r'url: "[^"]*"')
+
+
+def _exported_body(url, response, base_url):
+    # The spec url has no extension and prefixes the UI files, so it can't
+    # be written as a file: the UI page and the resource listing pointing at
+    # it are pointed at the written files instead
+    body = response.get_data()
+    if url.endswith("/_/static/index.html"):
+        listing_url = "{0}{1}/_/resource_list.json".format(
+            base_url.rstrip("/"), url[:-len("/_/static/index.html")])
+        return _ui_listing_url.sub(
+            'url: "{0}"'.format(listing_url), body.decode("utf-8"),
+            count=1).encode("utf-8")
+    if not url.endswith("/_/resource_list.json"):
+        return body
+    spec_url = url[:-len("/_/resource_list.json")]
+    listing = json.loads(body.decode("utf-8"))
+    for api in listing["apis"]:
+        if api["path"].endswith(spec_url):
+            api["path"] += ".json"
+    return json.dumps(listing).encode("utf-8")
+
+
+def export_docs(app, directory, base_url="http://localhost"):
+    """Writes every document served by the docs of app into directory.
+    :param app: The Flask app, after all of its resources were added.
+    :type app: Flask
+    :param directory: Where to write the documents, laid out like their urls.
+    :type directory: string
+    :param base_url: The url the documents will be served from.
+    :type base_url: string
+    :returns: The list of the files written.
+    """
+    written = []
+    for url, response in iter_documents(app, base_url):
+        if response.status_code != 200:
+            raise RuntimeError("GET {0} returned {1}".format(
+                url, response.status))
+        file_path = os.path.join(directory, *url.lstrip("/").split("/"))
+        try:
+            os.makedirs(os.path.dirname(file_path))
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        with open(file_path, "wb") as fs:
+            fs.write(_exported_body(url, response, base_url))
+        written.append(file_path)
+    return written
+
+
+# Set in the environ of the requests rendering the documents, which doc
+# serving middlewares let through to the app
+RENDERING = "flask_restful_swagger.rendering"
+
+_help_suffixes = (".help.json", ".help.html")
+
+# The request headers a document depends on, which it is rendered with
+_rendering_headers = ("accept-encoding", "x-forwarded-proto")
+
+# The response headers a 304 keeps
+_not_modified_headers = ("Cache-Control", "ETag", "Last-Modified", "Vary")
+
+
+class DocumentCache(object):
+    """
+    The documents served by the docs of an app, rendered once through the
+    app and then answered from memory.
+
+    Documents are rendered on first use, for each base url (specs embed it
+    as their basePath), query string and value of the request headers they
+    depend on (accepted encodings, forwarded protocol), and forgotten when a
+    resource or a model is documented.
+    """
+
+    def __init__(self, app, maxsize=1024):
+        self.app = app
+        self.lock = threading.Lock()
+        self.generation = None
+        self.urls = frozenset()
+        self.prefixes = ()
+        self.prefixes_generation = None
+        self.documents = LRUCache(maxsize)
+
+    def _generation(self):
+        app_registry = self.app.extensions.get(EXTENSION_NAME)
+        return (getattr(app_registry, "generation", None),
+                registry.generation)
+
+    def _refresh(self):
+        if self._generation() != self.generation:
+            with self.lock:
+                if self._generation() != self.generation:
+                    urls = set(document_urls(self.app))
+                    # A spec is also served at its endpoint_path, with no
+                    # extension
+                    urls.update(url[:-len(".json")] for url in list(urls)
+                                if url[:-len(".json")] +
+                                "/_/resource_list.json" in urls)
+                    self.documents.clear()
+                    self.urls = frozenset(urls)
+                    # document_urls builds the pending specs, which starts
+                    # a new generation
+                    self.generation = self._generation()
+        return self.urls
+
+    def serves(self, path):
+        """Tells whether path may be one of the documents, by its prefix (the
+        url of a spec, which prefixes the urls of its UI) or help suffix
+        alone. Lazy specs are not built.
+        """
+        generation = self._generation()
+        if generation != self.prefixes_generation:
+            self.prefixes = tuple(_spec_url(spec_registry[name])
+                                  for spec_registry, name
+                                  in _app_specs(self.app))
+            self.prefixes_generation = generation
+        return path.startswith(self.prefixes) or path.endswith(_help_suffixes)
+
+    def _key(self, path, base_url, query_string, headers):
+        return (self.generation, base_url, path, query_string) + tuple(
+            headers.get(name, "") for name in _rendering_headers)
+
+    def get(self, path, base_url, query_string="", headers=None):
+        """Returns a document served by the docs of the app.
+        :param path: The url path of the document, relative to the root of
+        the app.
+        :param base_url: The url the app is served from.
+        :param query_string: The query string of the request.
+        :param headers: The headers of the request, keyed by lower case name.
+        :type headers: dict
+        :returns: (status, headers, body) of the document, or None when path
+        isn't one of the documents.
+        """
+        headers = headers or {}
+        if path not in self._refresh():
+            return None
+        key = self._key(path, base_url, query_string, headers)
+        document = self.documents.get(key)
+        if document is None:
+            response = self.app.test_client().get(
+                path,
+                base_url=base_url,
+                query_string=query_string,
+                headers=dict((name, headers[name])
+                             for name in _rendering_headers
+                             if name in headers),
+                environ_base={RENDERING: True},
+            )
+            document = (
+                response.status,
+                list(response.headers.items()),
+                response.get_data(),
+            )
+            self.documents[key] = document
+        return document
+
+    def cached(self, path, base_url, query_string, headers):
+        """Like respond, without rendering anything.
+        :returns: (True, response) when the response is known, None being
+        the response when path isn't one of the documents, or (False, None)
+        when respond has to render it.
+        """
+        if self._generation() != self.generation:
+            return False, None
+        if path not in self.urls:
+            return True, None
+        document = self.documents.get(
+            self._key(path, base_url, query_string, headers))
+        if document is None:
+            return False, None
+        return True, self._conditional(document, headers)
+
+    def respond(self, path, base_url, query_string, headers):
+        """Like get, for a request with the given headers: a document the
+        client already has (If-None-Match, If-Modified-Since) is answered
+        with a 304.
+        :param headers: The headers of the request, keyed by lower case name.
+        :type headers: dict
+        """
+        document = self.get(path, base_url, query_string, headers)
+        if document is None:
+            return None
+        return self._conditional(document, headers)
+
+    @staticmethod
+    def _conditional(document, headers):
+        if "if-none-match" not in headers and \
+                "if-modified-since" not in headers:
+            return document
+        status, response_headers, body = document
+        etag = last_modified = None
+        for name, value in response_headers:
+            if name == "ETag":
+                etag = value
+            elif name == "Last-Modified":
+                last_modified = value
+        environ = dict(
+            ("HTTP_" + name.upper().replace("-", "_"), headers[name])
+            for name in ("if-none-match", "if-modified-since")
+            if name in headers)
+        if not (etag or last_modified) or is_resource_modified(
+                environ, etag, last_modified=last_modified):
+            return document
+        return "304 NOT MODIFIED", [
+            (name, value) for name, value in response_headers
+            if name in _not_modified_headers], b""
@@ -0,0 +1,85 @@
+"""
+An opt-in profiler of the time spent documenting each resource and model.
+"""
+import contextlib
+import sys
+import threading
+from timeit import default_timer
+
+
+class RegistrationProfiler(object):
+    """
+    Records where the time goes while documenting an api.
+
+    Time is recorded per subject, a resource url or a model being documented,
+    and per phase of its documentation (parsing docstrings, extracting the
+    operations, ...). Phases may nest, each one is timed inclusively.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (kind, name) of each subject -> {phase: seconds}
+        self.timings = {}
+        self._local = threading.local()
+
+    def _subjects(self):
+        if not hasattr(self._local, "subjects"):
+            self._local.subjects = []
+        return self._local.subjects
+
+    def _add(self, subject, phase, seconds):
+        with self.lock:
+            phases = self.timings.setdefault(subject, {})
+            phases[phase] = phases.get(phase, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def subject(self, kind, name):
+        subjects = self._subjects()
+        if subjects and subjects[-1] == (kind, name):
+            # Already recording this subject, its total covers the block
+            yield
+            return
+        subjects.append((kind, name))
+        start = default_timer()
+        try:
+            yield
+        finally:
+            subjects.pop()
+            self._add((kind, name), "total", default_timer() - start)
+
+    @contextlib.contextmanager
+    def phase(self, phase):
+        start = default_timer()
+        try:
+            yield
+        finally:
+            subjects = self._subjects()
+            if subjects:
+                self._add(subjects[-1], phase, default_timer() - start)
+
+    def report(self, limit=None):
+        """Returns the timings as text, the slowest subjects first.
+        :param limit: How many subjects to list, all of them by default.
+        :type limit: int
+        :returns: A string, one line per subject.
+        """
+        with self.lock:
+            timings = sorted(
+                self.timings.items(),
+                key=lambda item: item[1].get("total", 0.0),
+                reverse=True,
+            )
+        lines = ["flask-restful-swagger registration profile, "
+                 "slowest first:"]
+        for (kind, name), phases in timings[:limit]:
+            details = ", ".join(
+                "{0} {1:.2f}ms".format(phase, seconds * 1000)
+                for phase, seconds in sorted(phases.items())
+                if phase != "total")
+            lines.append("{0:>10.2f}ms  {1:<8} {2}{3}".format(
+                phases.get("total", 0.0) * 1000, kind, name,
+                "  ({0})".format(details) if details else ""))
+        return "\n".join(lines)
+
+    def dump(self, stream=None, limit=None):
+        (stream or sys.stderr).write(self.report(limit) + "\n")
@@ -0,0 +1,35 @@
+"""
+Timing signals, sent with the time spent building and serving the docs.
+
+Every signal is sent with a duration keyword argument, in seconds, and only
+when it has receivers. Signals need blinker to be installed, like Flask's.
+
+    from flask_restful_swagger import signals
+
+    def record(sender, duration, **extra):
+        metrics.timing("swagger.endpoint_built", duration)
+
+    signals.endpoint_built.connect(record)
+"""
+from flask.signals import Namespace
+
+_signals = Namespace()
+
+#: Sent by the first add_resource of a documented api, which registers the
+#: spec endpoints, with the api as sender and the endpoint_path of its spec.
+api_registered = _signals.signal("api-registered")
+
+#: Sent when the SwaggerEndpoint of a resource url is built, with the resource
+#: class as sender and the url as path.
+endpoint_built = _signals.signal("endpoint-built")
+
+#: Sent when a model is deduced and added to the registry, with the model
+#: class as sender.
+model_added = _signals.signal("model-added")
+
+#: Sent when a UI page is rendered, with the page as sender and cached set
+#: when it was served from the cache.
+page_rendered = _signals.signal("page-rendered")
+
+#: Sent when a static UI file is served, with the path of the file as sender.
+static_file_served = _signals.signal("static-file-served")
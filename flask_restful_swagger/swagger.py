@@ -1,14 +1,28 @@
+import contextlib
 import functools
+import gzip
+import hashlib
 import inspect
+import io
+import json
 import os
 import re
+from timeit import default_timer
 
 import six
-from flask import Response, abort, request
+from flask import (
+    Response,
+    abort,
+    after_this_request,
+    current_app,
+    has_request_context,
+    request,
+)
 from flask_restful import Resource, fields
-from jinja2 import Template
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
 
-from flask_restful_swagger import api_spec_static, registry
+from flask_restful_swagger import Registry, registry, signals
+from flask_restful_swagger.profiling import RegistrationProfiler
 
 try:
     # urlparse is renamed to urllib.parse in python 3
@@ -16,7 +30,44 @@ try:
 except ImportError:  # no cover
     from urllib import parse as urlparse
 
-resource_listing_endpoint = None
+try:
+    from werkzeug.routing import parse_rule
+except ImportError:  # no cover
+    # werkzeug>=2.2 doesn't expose its rule parser anymore, see _parse_rule
+    parse_rule = None
+
+try:
+    import dataclasses
+except ImportError:  # no cover
+    dataclasses = None
+
+try:
+    import typing
+except ImportError:  # no cover
+    typing = None
+
+try:
+    # brotli is optional, install flask-restful-swagger[brotli] to use it
+    import brotli
+except ImportError:  # no cover
+    brotli = None
+
+EXTENSION_NAME = "flask-restful-swagger"
+
+# When set, @swagger.model only records the class and the model is deduced on
+# the first doc request (or by warm_up), like the resources of a lazy api
+lazy_models = os.environ.get("FLASK_RESTFUL_SWAGGER_LAZY", "") not in ("", "0")
+
+# Model classes recorded while lazy_models is set
+_pending_models = []
+
+# Records the time spent documenting each resource and model when profiling
+# is on, either with the FLASK_RESTFUL_SWAGGER_PROFILE environment variable
+# (which also covers models declared before docs() is called) or with
+# docs(profile=True)
+profiler = None
+if os.environ.get("FLASK_RESTFUL_SWAGGER_PROFILE", "") not in ("", "0"):
+    profiler = RegistrationProfiler()
 
 
 def docs(
@@ -28,9 +79,31 @@ def docs(
         produces=["application/json"],
         api_spec_url="/api/spec",
         description="Auto generated API docs by flask-restful-swagger",
+        cache_spec=False,
+        etag=False,
+        compress=False,
+        static_max_age=None,
+        lazy=None,
+        split_resources=False,
+        profile=False,
+        help_routes=True,
 ):
 
     api_add_resource = api.add_resource
+    if lazy is None:
+        lazy = lazy_models
+    if profile:
+        enable_profiling()
+    if profiler is not None:
+        _dump_profile_on_first_request(api)
+    options = {
+        "cache_spec": cache_spec,
+        "etag": etag,
+        "compress": compress,
+        "static_max_age": static_max_age,
+        "split_resources": split_resources,
+        "help_routes": help_routes,
+    }
 
     def add_resource(resource, *urls, **kvargs):
         register_once(
@@ -43,23 +116,27 @@ def docs(
             produces,
             api_spec_url,
             description,
+            options=options,
         )
 
         resource = make_class(resource)
         for url in urls:
-            endpoint = swagger_endpoint(api, resource, url)
-
-            # Add a .help.json help url
-            swagger_path = extract_swagger_path(url)
-
-            # Add a .help.html help url
-            endpoint_html_str = "{0}/help".format(swagger_path)
-            api_add_resource(
-                endpoint,
-                "{0}.help.json".format(swagger_path),
-                "{0}.help.html".format(swagger_path),
-                endpoint=endpoint_html_str,
-            )
+            with _profiling("resource", resource, url):
+                # Its .help.json and .help.html urls are served by the help
+                # route of the api, from the swagger path
+                swagger_path = extract_swagger_path(url)
+                _register_endpoint(
+                    api, resource, url, swagger_path, lazy=lazy)
+                if help_routes and _shadows_help(url):
+                    api_add_resource(
+                        SwaggerHelp,
+                        swagger_path + _help_urls[1][1:],
+                        # Flask takes what precedes a dot in an endpoint
+                        # for the name of its blueprint
+                        endpoint="{0}/help".format(
+                            swagger_path.replace(".", ":")),
+                        defaults={"path": swagger_path[1:]},
+                    )
 
         return api_add_resource(resource, *urls, **kvargs)
 
@@ -71,6 +148,72 @@ def docs(
 rootPath = os.path.dirname(__file__)
 
 
+def enable_profiling():
+    global profiler
+    if profiler is None:
+        profiler = RegistrationProfiler()
+
+
+def profile_report(limit=None):
+    """
+  Returns the registration profile as text, the slowest resources and models
+  first, or None when profiling is off.
+  """
+    return profiler.report(limit) if profiler is not None else None
+
+
+def _dump_profile_on_first_request(api):
+    # Once per app, however many of its apis (or blueprints) are documented
+    def register(app):
+        funcs = getattr(app, "before_first_request_funcs", None)
+        if funcs is not None and _dump_profile not in funcs:
+            funcs.append(_dump_profile)
+
+    if api.blueprint is not None:
+        api.blueprint.record_once(lambda state: register(state.app))
+    elif api.app is not None:
+        register(api.app)
+
+
+def _dump_profile():
+    # Lazy specs are built by the first doc request, which dumps the profile
+    # once they are (see _build_current)
+    app_registry = current_app.extensions.get(EXTENSION_NAME)
+    if not _has_pending(app_registry) and not _has_pending(registry):
+        profiler.dump()
+
+
+def _profiled(phase):
+    # Records the time spent in the decorated function as phase of the
+    # resource or model being profiled
+    def decorator(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if profiler is None:
+                return f(*args, **kwargs)
+            with profiler.phase(phase):
+                return f(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _profiling(kind, subject, detail=None):
+    # The resource (and url) or model the profiled phases are recorded for
+    if profiler is None:
+        return _not_profiling()
+    name = getattr(subject, "__name__", subject)
+    if detail is not None:
+        name = "{0} {1}".format(name, detail)
+    return profiler.subject(kind, name)
+
+
+@contextlib.contextmanager
+def _not_profiling():
+    yield
+
+
 def make_class(class_or_instance):
     if inspect.isclass(class_or_instance):
         return class_or_instance
@@ -87,84 +230,341 @@ def register_once(
         produces,
         endpoint_path,
         description,
+        options=None,
 ):
-    global api_spec_static
-    global resource_listing_endpoint
-
-    if api.blueprint and not registry.get(api.blueprint.name):
-        # Most of all this can be taken from the blueprint/app
-        registry[api.blueprint.name] = {
-            "apiVersion": apiVersion,
-            "swaggerVersion": swaggerVersion,
-            "basePath": basePath,
-            "spec_endpoint_path": endpoint_path,
-            "resourcePath": resourcePath,
-            "produces": produces,
-            "x-api-prefix": "",
-            "apis": [],
-            "description": description,
+    reg = _api_registry(api)
+
+    # Registration may happen from several threads, e.g. when apps are built
+    # in parallel; the lock makes the check and the registration atomic
+    with reg.lock:
+        if api.blueprint and not reg.get(api.blueprint.name):
+            name = api.blueprint.name
+        elif "app" not in reg:
+            name = "app"
+        else:
+            return
+
+        with _timed(signals.api_registered, api,
+                    endpoint_path=endpoint_path):
+            if name != "app":
+                compile_templates()
+                # Most of all this can be taken from the blueprint/app
+                reg.settings[api.blueprint.name] = options or {}
+                reg.publish(api.blueprint.name, {
+                    "apiVersion": apiVersion,
+                    "swaggerVersion": swaggerVersion,
+                    "basePath": basePath,
+                    "spec_endpoint_path": endpoint_path,
+                    "resourcePath": resourcePath,
+                    "produces": produces,
+                    "x-api-prefix": "",
+                    "apis": [],
+                    "description": description,
+                })
+
+                # Blueprints aren't bound to an app, their specs always live in
+                # the module level registry
+                def registering_blueprint(setup_state):
+                    registry.update_entry(
+                        setup_state.blueprint.name,
+                        **{"x-api-prefix": setup_state.url_prefix})
+
+                api.blueprint.record(registering_blueprint)
+
+                add_resource_func(
+                    SwaggerRegistry,
+                    endpoint_path,
+                    endpoint_path + ".json",
+                    endpoint_path + ".html",
+                )
+
+                add_resource_func(
+                    ResourceLister, endpoint_path + "/_/resource_list.json")
+
+                add_resource_func(SpecChanges, endpoint_path + "/_/changes")
+
+                if options and options.get("split_resources"):
+                    add_resource_func(
+                        ApiDeclaration,
+                        endpoint_path + "/_/resources/<string:group>",
+                    )
+
+                if options and options.get("help_routes"):
+                    add_resource_func(SwaggerHelp, *_help_urls)
+
+                api_spec_static = endpoint_path + "/_/static/"
+                static_resource, static_kwargs = _static_resource(options)
+                add_resource_func(
+                    static_resource,
+                    api_spec_static +
+                    "<string:dir1>/<string:dir2>/<string:dir3>",
+                    api_spec_static + "<string:dir1>/<string:dir2>",
+                    api_spec_static + "<string:dir1>",
+                    **static_kwargs
+                )
+            else:
+                compile_templates()
+                reg.settings["app"] = options or {}
+                reg.publish("app", {
+                    "apiVersion": apiVersion,
+                    "swaggerVersion": swaggerVersion,
+                    "basePath": basePath,
+                    "spec_endpoint_path": endpoint_path,
+                    "resourcePath": resourcePath,
+                    "produces": produces,
+                    "description": description,
+                })
+
+                add_resource_func(
+                    SwaggerRegistry,
+                    endpoint_path,
+                    endpoint_path + ".json",
+                    endpoint_path + ".html",
+                    endpoint="app/registry",
+                )
+
+                add_resource_func(
+                    ResourceLister,
+                    endpoint_path + "/_/resource_list.json",
+                    endpoint="app/resourcelister",
+                )
+
+                add_resource_func(
+                    SpecChanges,
+                    endpoint_path + "/_/changes",
+                    endpoint="app/changes",
+                )
+
+                if options and options.get("split_resources"):
+                    add_resource_func(
+                        ApiDeclaration,
+                        endpoint_path + "/_/resources/<string:group>",
+                        endpoint="app/declarations",
+                    )
+
+                if options and options.get("help_routes"):
+                    add_resource_func(
+                        SwaggerHelp, *_help_urls, endpoint="app/help")
+
+                api_spec_static = endpoint_path + "/_/static/"
+                static_resource, static_kwargs = _static_resource(options)
+                add_resource_func(
+                    static_resource,
+                    api_spec_static +
+                    "<string:dir1>/<string:dir2>/<string:dir3>",
+                    api_spec_static + "<string:dir1>/<string:dir2>",
+                    api_spec_static + "<string:dir1>",
+                    endpoint="app/staticfiles",
+                    **static_kwargs
+                )
+
+
+def _static_resource(options):
+    max_age = (options or {}).get("static_max_age")
+    if max_age is None:
+        return StaticFiles, {}
+    _load_static_files()
+    return CachedStaticFiles, {"resource_class_kwargs": {"max_age": max_age}}
+
+
+# When set, compiled templates are kept in this (existing) directory, so that
+# new workers load them instead of parsing the templates again
+template_cache_dir = os.environ.get("FLASK_RESTFUL_SWAGGER_TEMPLATE_CACHE")
+
+template_env = Environment(
+    loader=PackageLoader("flask_restful_swagger", "static"),
+    auto_reload=False,
+    bytecode_cache=(FileSystemBytecodeCache(template_cache_dir)
+                    if template_cache_dir else None),
+)
+
+# Static UI assets, keyed by their path relative to static/
+_static_files = {}
+
+# These are jinja templates and are rendered by render_page
+_rendered_files = (
+    "index.html",
+    "o2c.html",
+    "swagger-ui.js",
+    "swagger-ui.min.js",
+    "lib/swagger-oauth.js",
+)
+
+# Every page render_page is used for
+_templates = _rendered_files + ("endpoint.html",)
+
+
+def compile_templates():
+    """
+  Compiles every UI template into the shared environment, ahead of the first
+  request that renders it.
+  """
+    for page in _templates:
+        template_env.get_template(page)
+
+
+def _walk_static_files():
+    # (path relative to static/, full path) of each static UI file
+    static_root = os.path.join(rootPath, "static")
+    for dirpath, _, filenames in os.walk(static_root):
+        for filename in filenames:
+            full_path = os.path.join(dirpath, filename)
+            file_path = os.path.relpath(full_path, static_root)
+            yield file_path.replace(os.sep, "/"), full_path
+
+
+def _load_static_files():
+    # Apps built in other threads may be serving _static_files already, so
+    # it is only replaced once every file is loaded
+    global _static_files
+    if _static_files:
+        return
+    static_files = {}
+    for file_path, full_path in _walk_static_files():
+        with open(full_path, "rb") as fs:
+            body = fs.read()
+        static_files[file_path] = {
+            "body": body,
+            "mimetype": _static_mimetype(file_path),
+            "last_modified": int(os.path.getmtime(full_path)),
         }
+    _static_files = static_files
 
-        def registering_blueprint(setup_state):
-            reg = registry[setup_state.blueprint.name]
-            reg["x-api-prefix"] = setup_state.url_prefix
 
-        api.blueprint.record(registering_blueprint)
+def _static_mimetype(filePath):
+    mime = "text/plain"
+    if filePath.endswith(".gif"):
+        mime = "image/gif"
+    elif filePath.endswith(".png"):
+        mime = "image/png"
+    elif filePath.endswith(".js"):
+        mime = "text/javascript"
+    elif filePath.endswith(".css"):
+        mime = "text/css"
+    return mime
 
-        add_resource_func(
-            SwaggerRegistry,
-            endpoint_path,
-            endpoint_path + ".json",
-            endpoint_path + ".html",
-        )
 
-        resource_listing_endpoint = endpoint_path + "/_/resource_list.json"
-        add_resource_func(ResourceLister, resource_listing_endpoint)
+@contextlib.contextmanager
+def _timed(signal, sender, **extra):
+    # Sends signal with the duration of the block, when it has receivers. The
+    # block may add to the extra keyword arguments of the signal it is given.
+    if not getattr(signal, "receivers", None):
+        yield extra
+        return
+    start = default_timer()
+    yield extra
+    signal.send(sender, duration=default_timer() - start, **extra)
 
-        api_spec_static = endpoint_path + "/_/static/"
-        add_resource_func(
-            StaticFiles,
-            api_spec_static + "<string:dir1>/<string:dir2>/<string:dir3>",
-            api_spec_static + "<string:dir1>/<string:dir2>",
-            api_spec_static + "<string:dir1>",
-        )
-    elif "app" not in registry:
-        registry["app"] = {
-            "apiVersion": apiVersion,
-            "swaggerVersion": swaggerVersion,
-            "basePath": basePath,
-            "spec_endpoint_path": endpoint_path,
-            "resourcePath": resourcePath,
-            "produces": produces,
-            "description": description,
-        }
 
-        add_resource_func(
-            SwaggerRegistry,
-            endpoint_path,
-            endpoint_path + ".json",
-            endpoint_path + ".html",
-            endpoint="app/registry",
-        )
+def _current_app_name():
+    return request.blueprint or "app"
 
-        resource_listing_endpoint = endpoint_path + "/_/resource_list.json"
-        add_resource_func(
-            ResourceLister,
-            resource_listing_endpoint,
-            endpoint="app/resourcelister",
-        )
 
-        api_spec_static = endpoint_path + "/_/static/"
-        add_resource_func(
-            StaticFiles,
-            api_spec_static + "<string:dir1>/<string:dir2>/<string:dir3>",
-            api_spec_static + "<string:dir1>/<string:dir2>",
-            api_spec_static + "<string:dir1>",
-            endpoint="app/staticfiles",
-        )
+def _current_registry(app_name):
+    # The Registry holding the spec of app_name for the current app
+    app_registry = current_app.extensions.get(EXTENSION_NAME)
+    if app_registry is not None and app_name in app_registry:
+        return app_registry
+    return registry
+
+
+def _current_generation():
+    # Models live in the module level registry, so a cached document is
+    # built from both generations. Lazy specs are built first, so that the
+    # generation covers what the request then reads
+    app_registry = _current_registry(_current_app_name())
+    _build_current(app_registry)
+    return (app_registry.generation, registry.generation)
+
 
+def _build_current(app_registry):
+    # Builds the lazy parts of the specs a request reads: those of its app
+    # (or blueprint) and the models
+    built = build_pending(app_registry)
+    if app_registry is not registry:
+        built = build_pending(registry) or built
+    if built and profiler is not None:
+        profiler.dump()
 
-templates = {}
+
+def _spec_generation(generation):
+    # Generations come from a shared clock, so the later of the two is the
+    # generation of the spec
+    return max(generation)
+
+
+def _encode_spec(spec):
+    json_settings = current_app.config.get("RESTFUL_JSON", {})
+    return (json.dumps(spec, **json_settings) + "\n").encode("utf-8")
+
+
+def _fingerprint(data):
+    # Sorted keys and fixed separators, so that every worker and node
+    # computes the same fingerprint (and ETag) for the same data. The other
+    # RESTFUL_JSON settings (default, cls) are those the spec is encoded with
+    json_settings = dict(current_app.config.get("RESTFUL_JSON", {}))
+    json_settings.update(sort_keys=True, indent=None, separators=(",", ":"))
+    canonical = json.dumps(data, **json_settings)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _compress(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body)
+    buf = io.BytesIO()
+    # A fixed mtime keeps the compressed bytes identical across workers
+    with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as fs:
+        fs.write(body)
+    return buf.getvalue()
+
+
+def _negotiate_encoding(options):
+    if not options.get("compress"):
+        return None
+    available = ["br", "gzip"] if brotli else ["gzip"]
+    return request.accept_encodings.best_match(available)
+
+
+def _json_response(key, data):
+    """
+  Returns data as-is, unless the API was documented with cache_spec, etag or
+  compress, in which case the encoded body (its ETag and its compressed
+  variants) is computed once per key and served from the registry cache
+  until the registry changes.
+  The key must start with the registry generation as read *before* data was
+  taken from the registry, so that a concurrent write can't be cached.
+  """
+    app_name = _current_app_name()
+    app_registry = _current_registry(app_name)
+    options = app_registry.settings.get(app_name, {})
+    if not any(options.get(o) for o in ("cache_spec", "etag", "compress")):
+        return data
+    key = (app_name,) + key
+    entry = app_registry.cache.get(key)
+    if entry is None:
+        entry = {"body": _encode_spec(data), "encoded": {}}
+        if options.get("etag"):
+            entry["etag"] = _fingerprint(data)
+        app_registry.cache[key] = entry
+
+    body, etag = entry["body"], entry.get("etag")
+    encoding = _negotiate_encoding(options)
+    if encoding:
+        if encoding not in entry["encoded"]:
+            entry["encoded"][encoding] = _compress(body, encoding)
+        body = entry["encoded"][encoding]
+        # Each representation needs its own strong validator
+        etag = etag and "{0}-{1}".format(etag, encoding)
+
+    response = Response(body, mimetype="application/json")
+    if options.get("compress"):
+        response.vary.add("Accept-Encoding")
+    if encoding:
+        response.content_encoding = encoding
+    if etag:
+        response.set_etag(etag)
+        response.make_conditional(request)
+    return response
 
 
 def render_endpoint(endpoint):
@@ -176,15 +576,32 @@ def render_homepage(resource_list_url):
     return render_page("index.html", conf)
 
 
+def _api_name(api):
+    return api.blueprint.name if api.blueprint else "app"
+
+
+def _api_registry(api):
+    # flask-restful keeps a blueprint in api.app, too
+    if api.blueprint or api.app is None:
+        return registry
+    return api.app.extensions.setdefault(EXTENSION_NAME, Registry())
+
+
 def _get_current_registry(api=None):
-    # import ipdb;ipdb.set_trace()
-    global registry
+    """
+  Returns a per-request view of the registry: a shallow copy of the entry of
+  the current blueprint (or app) with the request specific fields laid on
+  top of it. The shared registry is never written to, so concurrent requests
+  can't race on it and the prefix isn't appended twice.
+  """
     app_name = None
     overrides = {}
     if api:
         app_name = api.blueprint.name if api.blueprint else None
+        source = _api_registry(api)
     else:
         app_name = request.blueprint
+        source = _current_registry(app_name or "app")
         urlparts = urlparse.urlparse(request.url_root.rstrip("/"))
         proto = request.headers.get("x-forwarded-proto") or urlparts[0]
         overrides = {
@@ -194,44 +611,74 @@ def _get_current_registry(api=None):
     if not app_name:
         app_name = "app"
 
+    _build_current(source)
     overrides["models"] = registry.get("models", {})
 
-    reg = registry.setdefault(app_name, {})
+    reg = dict(source.get(app_name, {}))
     reg.update(overrides)
 
-    reg["basePath"] = reg["basePath"] + (reg.get("x-api-prefix", "") or "")
+    reg["basePath"] = (reg.get("basePath", "") +
+                       (reg.get("x-api-prefix", "") or ""))
 
     return reg
 
 
+def _page_key(info):
+    # Tells apart the renders of a page by the swagger path of the endpoint,
+    # or the resource listing url, they are rendered with. None when info
+    # holds neither, the page is then rendered on each request
+    if not info:
+        return ()
+    for field in ("resource_list_url", "path"):
+        if field in info:
+            return (field, info[field])
+    return None
+
+
 def render_page(page, info):
+    """
+  Renders a UI template. During a request the rendered bytes are kept in the
+  registry cache, keyed by page, base url and the endpoint path (or resource
+  listing url) it is rendered with, until the registry changes.
+  """
+    cache = None
+    if has_request_context():
+        app_name = _current_app_name()
+        cache = _current_registry(app_name).cache
+        generation = _current_generation()
     req_registry = _get_current_registry()
     url = req_registry["basePath"]
     if url.endswith("/"):
         url = url.rstrip("/")
+    api_spec_static = req_registry.get("spec_endpoint_path", "") + "/_/static/"
     conf = {
         "base_url": url + api_spec_static,
         "full_base_url": url + api_spec_static,
     }
     if info is not None:
         conf.update(info)
-    global templates
-    if page in templates:
-        template = templates[page]
-    else:
-        with open(os.path.join(rootPath, "static", page), "r") as fs:
-            template = Template(fs.read())
-            templates[page] = template
     mime = "text/html"
     if page.endswith(".js"):
         mime = "text/javascript"
-    return Response(template.render(conf), mimetype=mime)
+
+    page_key = _page_key(info)
+    with _timed(signals.page_rendered, page, cached=False) as timing:
+        if cache is None or page_key is None:
+            return Response(template_env.get_template(page).render(conf),
+                            mimetype=mime)
+        key = (app_name, generation, "page", page, url) + page_key
+        body = cache.get(key)
+        if body is None:
+            body = template_env.get_template(page).render(conf).encode(
+                "utf-8")
+            cache[key] = body
+        else:
+            timing["cached"] = True
+        return Response(body, mimetype=mime)
 
 
 class StaticFiles(Resource):
     def get(self, dir1=None, dir2=None, dir3=None):
-        req_registry = _get_current_registry()
-
         if dir1 is None:
             filePath = "index.html"
         else:
@@ -240,24 +687,17 @@ class StaticFiles(Resource):
                 filePath = "%s/%s" % (filePath, dir2)
                 if dir3 is not None:
                     filePath = "%s/%s" % (filePath, dir3)
-        if filePath in [
-                "index.html",
-                "o2c.html",
-                "swagger-ui.js",
-                "swagger-ui.min.js",
-                "lib/swagger-oauth.js",
-        ]:
-            conf = {"resource_list_url": req_registry["spec_endpoint_path"]}
-            return render_page(filePath, conf)
-        mime = "text/plain"
-        if filePath.endswith(".gif"):
-            mime = "image/gif"
-        elif filePath.endswith(".png"):
-            mime = "image/png"
-        elif filePath.endswith(".js"):
-            mime = "text/javascript"
-        elif filePath.endswith(".css"):
-            mime = "text/css"
+        with _timed(signals.static_file_served, filePath):
+            if filePath in _rendered_files:
+                req_registry = _get_current_registry()
+                conf = {
+                    "resource_list_url": req_registry["spec_endpoint_path"],
+                }
+                return render_page(filePath, conf)
+            return self.send_file(filePath)
+
+    def send_file(self, filePath):
+        mime = _static_mimetype(filePath)
         filePath = os.path.join(rootPath, "static", filePath)
         if os.path.exists(filePath):
             fs = open(filePath, "rb")
@@ -265,42 +705,420 @@ class StaticFiles(Resource):
         abort(404)
 
 
+class CachedStaticFiles(StaticFiles):
+    """
+  Serves the UI assets from memory, as loaded by _load_static_files when the
+  API was documented with static_max_age, together with caching headers.
+  """
+    def __init__(self, max_age=0):
+        self.max_age = max_age
+
+    def send_file(self, filePath):
+        asset = _static_files.get(filePath)
+        if asset is None:
+            abort(404)
+        response = Response(asset["body"], mimetype=asset["mimetype"])
+        response.cache_control.public = True
+        response.cache_control.max_age = self.max_age
+        response.last_modified = asset["last_modified"]
+        response.make_conditional(request)
+        return response
+
+
 class ResourceLister(Resource):
     def get(self):
+        generation = _current_generation()
         req_registry = _get_current_registry()
-        return {
+        spec_url = (req_registry["basePath"] +
+                    req_registry["spec_endpoint_path"])
+        app_name = _current_app_name()
+        app_registry = _current_registry(app_name)
+        if app_registry.settings.get(app_name, {}).get("split_resources"):
+            # One API declaration per top level path segment, which the UI
+            # fetches on its own
+            index = app_registry.indexes.get(app_name) or EndpointIndex()
+            apis = []
+            for group in index.group_names():
+                apis.append({
+                    "path": spec_url + "/_/resources/" + (group or "_"),
+                    "description": (index.groups[group]["description"] or
+                                    req_registry["description"]),
+                })
+        else:
+            apis = [{
+                "path": spec_url,
+                "description": req_registry["description"],
+            }]
+        listing = {
             "apiVersion":
             req_registry["apiVersion"],
             "swaggerVersion":
             req_registry["swaggerVersion"],
-            "apis": [{
-                "path": (req_registry["basePath"] +
-                         req_registry["spec_endpoint_path"]),
-                "description":
-                req_registry["description"],
-            }],
+            "apis": apis,
+        }
+        return _json_response(
+            (generation, "listing", req_registry["basePath"]), listing)
+
+
+class ApiDeclaration(Resource):
+    def get(self, group):
+        # The endpoints at the root of the api are listed under "_"
+        if group == "_":
+            group = ""
+        generation = _current_generation()
+        req_registry = _get_current_registry()
+        app_name = _current_app_name()
+        index = _current_registry(app_name).indexes.get(app_name)
+        if index is None or group not in index.groups:
+            abort(404)
+        declaration = _filter_spec(generation, req_registry, ("group", group),
+                                   lambda index: index.find_group(group))
+        declaration["resourcePath"] = "/" + group
+        return _json_response(
+            (generation, "declaration", req_registry["basePath"], group),
+            declaration)
+
+
+class SpecChanges(Resource):
+    def get(self):
+        """
+    Lists the endpoints and models added or changed since the generation
+    given as ?since=, answers 410 Gone when the log doesn't go back that far.
+    """
+        since = request.args.get("since", 0, type=int)
+        app_name = _current_app_name()
+        app_registry = _current_registry(app_name)
+        # Builds lazy apis, so that their changes are logged
+        _get_current_registry()
+        sources = [(app_registry, (app_name, "models"))]
+        if app_registry is not registry:
+            sources = [(app_registry, (app_name,)), (registry, ("models",))]
+
+        generation = _spec_generation(_current_generation())
+        changes = []
+        for source, names in sources:
+            with source.lock:
+                if since < source.forgotten:
+                    abort(410)
+                for change in reversed(source.changes):
+                    if change[0] <= since:
+                        break
+                    if change[0] <= generation and change[1] in names:
+                        changes.append(change)
+        changes.sort(key=lambda change: change[0])
+        return {
+            "generation": generation,
+            "changes": [dict(change, generation=change_generation)
+                        for change_generation, _, change in changes],
         }
 
 
-def swagger_endpoint(api, resource, path):
-    endpoint = SwaggerEndpoint(resource, path)
-    req_registry = _get_current_registry(api=api)
-    req_registry.setdefault("apis", []).append(endpoint.__dict__)
+# One route serves the help of every resource of an api, looked up by its
+# swagger path (the root resource has no path segment to match)
+_help_urls = (
+    "/<path:path>.help.<any(json, html):ext>",
+    "/.help.<any(json, html):ext>",
+)
+
+
+class SwaggerHelp(Resource):
+    def get(self, ext, path=""):
+        app_name = _current_app_name()
+        reg = _current_registry(app_name)
+        registration = reg.help.get(app_name, {}).get("/" + path)
+        if registration is None:
+            abort(404)
+        return _help_response(reg, registration, ext)
+
+
+def _shadows_help(url):
+    """
+  Tells whether the rule of url matches its own help urls, which werkzeug
+  would then prefer to the help route (as with a trailing string or path
+  argument), so that they need a rule of their own.
+  """
+    return _parse_path(url)[2]
+
+
+def _register_endpoint(api, resource, path, swagger_path, lazy=False):
+    # Documents resource at path, as the help of swagger_path
+    reg = _api_registry(api)
+    registration = {
+        "name": _api_name(api),
+        "resource": resource,
+        "path": path,
+        "endpoint": None,
+    }
+    with reg.lock:
+        reg.help.setdefault(registration["name"], {})[
+            swagger_path] = registration
+        if lazy:
+            reg.pending.append(registration)
+    if not lazy:
+        _build_endpoints(reg, [registration])
+    return reg, registration
+
+
+def _help_response(reg, registration, ext):
+    if registration["endpoint"] is None:
+        build_pending(reg)
+    endpoint = registration["endpoint"]
+    if ext == "json":
+        return _json_response(
+            (_current_generation(), "help", endpoint.path),
+            endpoint.__dict__)
+    return render_endpoint(endpoint)
+
+
+def swagger_endpoint(api, resource, path, lazy=False):
+    """
+  Documents resource at path and returns a Resource serving its help at the
+  .help.json and .help.html urls of path. docs() serves the help of all the
+  resources of an api from a single route instead, this is kept for the apps
+  adding help urls of their own.
+  """
+    reg, registration = _register_endpoint(
+        api, resource, path, extract_swagger_path(path), lazy=lazy)
 
     class SwaggerResource(Resource):
         def get(self):
             if request.path.endswith(".help.json"):
-                return endpoint.__dict__
+                return _help_response(reg, registration, "json")
             if request.path.endswith(".help.html"):
-                return render_endpoint(endpoint)
+                return _help_response(reg, registration, "html")
 
     return SwaggerResource
 
 
+def _build_endpoints(reg, registrations):
+    # Builds the SwaggerEndpoint of each registration and publishes them all
+    # at once, so a lazy api with many resources is only copied once
+    apis = {}
+    for registration in registrations:
+        registration["endpoint"] = SwaggerEndpoint(registration["resource"],
+                                                   registration["path"])
+        apis.setdefault(registration["name"], []).append(
+            registration["endpoint"].__dict__)
+    with reg.lock:
+        for name, added in apis.items():
+            index = reg.indexes.get(name) or EndpointIndex()
+            entry = dict(reg.get(name, {}))
+            entry["apis"] = entry.get("apis", []) + added
+            reg.publish(name, entry, changes=[
+                {"action": "added", "api": endpoint} for endpoint in added],
+                index=index.extended(added))
+
+
+def _has_pending(reg):
+    return reg is not None and bool(
+        reg.pending or (reg is registry and _pending_models))
+
+
+def build_pending(reg):
+    """
+  Builds the resources and models recorded by lazy apis, and returns True
+  when there were any.
+  """
+    if not _has_pending(reg):
+        return False
+    # Building under the lock means concurrent first requests wait for the
+    # complete spec, instead of building it twice. The pending lists are only
+    # emptied once their entries are published: a request finding them set
+    # waits on the lock, and finds them empty once it gets it
+    with reg.lock:
+        # Another request may have built them while this one waited
+        built = _has_pending(reg)
+        if reg.pending:
+            _build_endpoints(reg, reg.pending)
+            reg.pending = []
+        if reg is registry and _pending_models:
+            models = list(_pending_models)
+            for model_class in models:
+                add_model(model_class)
+            del _pending_models[:len(models)]
+    return built
+
+
+def warm_up(app=None):
+    """
+  Builds whatever lazy apis and lazy models have recorded so far, and compiles
+  the UI templates, so that the first doc request doesn't have to. Pass the
+  app to also build the specs kept in its app.extensions.
+  """
+    if app is not None and EXTENSION_NAME in app.extensions:
+        build_pending(app.extensions[EXTENSION_NAME])
+    build_pending(registry)
+    compile_templates()
+
+
+def _path_segments(path):
+    return [segment for segment in path.split("/") if segment]
+
+
+def _endpoint_tags(endpoint):
+    tags = set()
+    for op in endpoint["operations"]:
+        op_tags = op.get("tags") or []
+        if isinstance(op_tags, six.string_types):
+            op_tags = [op_tags]
+        tags.update(op_tags)
+    return frozenset(tags)
+
+
+class EndpointIndex(object):
+    """
+  Indexes the endpoints of one spec by path, in a trie of path segments, and
+  by the tags of their operations (@swagger.operation(tags=[...])), so that
+  a filtered spec costs the size of its result rather than the size of the
+  whole api. Lookups return endpoints in the order they were added.
+
+  A published index is never modified, like the entries of the registry:
+  extended returns a copy with more endpoints.
+  """
+
+    def __init__(self):
+        self.size = 0
+        # Each node maps a path segment to its child node, and None to the
+        # endpoints whose path ends there
+        self.root = {}
+        self.tags = {}
+        # The first endpoint of each top level path segment, "" for the
+        # endpoints at the root
+        self.groups = {}
+        # The ids of the nodes and lists of this index that no other index
+        # shares, which may be changed in place
+        self._owned = None
+
+    def _own(self, container):
+        if self._owned is None or id(container) in self._owned:
+            return container
+        container = type(container)(container)
+        self._owned.add(id(container))
+        return container
+
+    def add(self, endpoint):
+        item = (self.size, endpoint, _endpoint_tags(endpoint))
+        self.size += 1
+        segments = _path_segments(endpoint["path"])
+        self.groups.setdefault(segments[0] if segments else "", endpoint)
+        node = self.root
+        for segment in segments:
+            child = node[segment] = self._own(node.get(segment) or {})
+            node = child
+        node[None] = self._own(node.get(None) or [])
+        node[None].append(item)
+        for tag in item[2]:
+            self.tags[tag] = self._own(self.tags.get(tag) or [])
+            self.tags[tag].append(item)
+
+    def extended(self, endpoints):
+        """
+    Returns a copy of the index with endpoints added. Only the nodes on their
+    paths are copied, the rest is shared with this index, which is left as
+    it is for the readers still using it.
+    """
+        index = EndpointIndex()
+        index.size = self.size
+        index.root = dict(self.root)
+        index.tags = dict(self.tags)
+        index.groups = dict(self.groups)
+        index._owned = set([id(index.root)])
+        for endpoint in endpoints:
+            index.add(endpoint)
+        index._owned = None
+        return index
+
+    def find(self, path_prefix=None, tag=None):
+        """
+    Returns the endpoints under path_prefix (whole segments, so /todos
+    matches /todos/{id} but not /todos_archive) having the given tag.
+    """
+        if path_prefix is None:
+            return [item[1] for item in self.tags.get(tag, [])]
+        node = self.root
+        for segment in _path_segments(path_prefix):
+            node = node.get(segment)
+            if node is None:
+                return []
+        items = []
+        nodes = [node]
+        while nodes:
+            node = nodes.pop()
+            for segment, child in node.items():
+                if segment is None:
+                    items.extend(child)
+                else:
+                    nodes.append(child)
+        items.sort(key=lambda item: item[0])
+        return [item[1] for item in items
+                if tag is None or tag in item[2]]
+
+    def group_names(self):
+        return sorted(self.groups)
+
+    def find_group(self, group):
+        if group:
+            return self.find("/" + group)
+        return [item[1] for item in self.root.get(None, [])]
+
+
+def _model_refs(node):
+    # The names a fragment of the spec may refer to a model by
+    if isinstance(node, dict):
+        for key in ("responseClass", "dataType", "type", "$ref"):
+            if isinstance(node.get(key), six.string_types):
+                yield node[key]
+        node = list(node.values())
+    if isinstance(node, list):
+        for value in node:
+            if isinstance(value, (dict, list)):
+                for ref in _model_refs(value):
+                    yield ref
+
+
+def referenced_models(apis, models):
+    """
+  Returns the models the given apis refer to, directly or through the
+  properties of other models.
+  """
+    found = {}
+    refs = list(_model_refs(apis))
+    while refs:
+        name = refs.pop()
+        if name in models and name not in found:
+            found[name] = models[name]
+            refs.extend(_model_refs(models[name]))
+    return found
+
+
+def _filter_spec(generation, spec, query, find):
+    """
+  Returns a copy of spec with only the apis find(index) picks from the index
+  of the current spec, and the models they refer to. The selection is cached
+  under query until the registry changes.
+  """
+    app_name = _current_app_name()
+    app_registry = _current_registry(app_name)
+    key = (app_name, generation, "filter") + query
+    filtered = app_registry.cache.get(key)
+    if filtered is None:
+        index = app_registry.indexes.get(app_name)
+        apis = find(index) if index else []
+        filtered = {
+            "apis": apis,
+            "models": referenced_models(apis, spec["models"]),
+        }
+        app_registry.cache[key] = filtered
+    spec = dict(spec)
+    spec.update(filtered)
+    return spec
+
+
 def _sanitize_doc(comment):
     return comment.replace("\n", "<br/>") if comment else comment
 
 
+@_profiled("parse_doc")
 def _parse_doc(obj):
     first_line, other_lines = None, None
 
@@ -318,68 +1136,125 @@ def _parse_doc(obj):
 
 class SwaggerEndpoint(object):
     def __init__(self, resource, path):
-        self.path = extract_swagger_path(path)
-        path_arguments = extract_path_arguments(path)
-        self.description, self.notes = _parse_doc(resource)
-        self.operations = self.extract_operations(resource, path_arguments)
+        with _timed(signals.endpoint_built, resource, path=path), \
+                _profiling("resource", resource, path):
+            self.path = extract_swagger_path(path)
+            path_arguments = extract_path_arguments(path)
+            self.description, self.notes = _parse_doc(resource)
+            self.operations = self.extract_operations(resource,
+                                                      path_arguments)
 
     @staticmethod
+    @_profiled("extract_operations")
     def extract_operations(resource, path_arguments=[]):
         operations = []
         for method in [m.lower() for m in resource.methods]:
-            method_impl = resource.__dict__.get(method, None)
-            if method_impl is None:
-                for cls in resource.__mro__:
-                    for item_key in cls.__dict__.keys():
-                        if item_key == method:
-                            method_impl = cls.__dict__[item_key]
-            op = {
-                "method": method,
-                "parameters": path_arguments,
-                "nickname": "nickname",
-            }
-            op["summary"], op["notes"] = _parse_doc(method_impl)
-
-            if "__swagger_attr" in method_impl.__dict__:
-                # This method was annotated with @swagger.operation
-                decorators = method_impl.__dict__["__swagger_attr"]
-                for att_name, att_value in list(decorators.items()):
-                    if isinstance(att_value, six.string_types + (int, list)):
-                        if att_name == "parameters":
-                            op["parameters"] = merge_parameter_list(
-                                op["parameters"], att_value)
-                        else:
-                            if op.get(att_name) and att_name != "nickname":
-                                att_value = "{0}<br/>{1}".format(
-                                    att_value, op[att_name])
-                            op[att_name] = att_value
-                    elif isinstance(att_value, object):  # no cover
-                        op[att_name] = att_value.__name__
-                operations.append(op)
+            template = _operation_template(resource, method)
+            if template is None:
+                continue
+            op = dict(template)
+            if template["parameters"] is None:
+                op["parameters"] = path_arguments
+            else:
+                op["parameters"] = merge_parameter_list(
+                    path_arguments, template["parameters"])
+            operations.append(op)
         return operations
 
 
+# The operation documented by each (resource class, method), before the path
+# arguments of a url are merged into its parameters (None when the method
+# doesn't document any)
+_operation_templates = {}
+
+
+def _operation_template(resource, method):
+    key = (resource, method)
+    try:
+        return _operation_templates[key]
+    except KeyError:
+        pass
+
+    # The implementation the method dispatches to, i.e. the first one along
+    # the MRO
+    method_impl = None
+    for cls in inspect.getmro(resource):
+        if method in cls.__dict__:
+            method_impl = cls.__dict__[method]
+            break
+
+    template = None
+    if "__swagger_attr" in getattr(method_impl, "__dict__", {}):
+        # This method was annotated with @swagger.operation
+        template = {
+            "method": method,
+            "parameters": None,
+            "nickname": "nickname",
+        }
+        template["summary"], template["notes"] = _parse_doc(method_impl)
+        decorators = method_impl.__dict__["__swagger_attr"]
+        for att_name, att_value in list(decorators.items()):
+            if isinstance(att_value, six.string_types + (int, list)):
+                if att_name == "parameters":
+                    template["parameters"] = att_value
+                else:
+                    if template.get(att_name) and att_name != "nickname":
+                        att_value = "{0}<br/>{1}".format(
+                            att_value, template[att_name])
+                    template[att_name] = att_value
+            elif isinstance(att_value, object):  # no cover
+                template[att_name] = att_value.__name__
+    _operation_templates[key] = template
+    return template
+
+
+@_profiled("merge_parameter_list")
 def merge_parameter_list(base, override):
-    base = list(base)
-    names = [x["name"] for x in base]
-    for o in override:
-        if o["name"] in names:
-            for n, i in enumerate(base):
-                if i["name"] == o["name"]:
-                    base[n] = o
+    """
+  Returns the parameters of base, in order, with those of override replacing
+  the ones with the same name and paramType, followed by the other
+  parameters of override. The parameter dicts themselves aren't copied.
+  """
+    merged = list(base)
+    positions = {}
+    for n, parameter in enumerate(merged):
+        key = (parameter.get("name"), parameter.get("paramType"))
+        positions.setdefault(key, []).append(n)
+    for parameter in override:
+        key = (parameter.get("name"), parameter.get("paramType"))
+        if key in positions:
+            for n in positions[key]:
+                merged[n] = parameter
         else:
-            base.append(o)
-    return base
+            positions[key] = [len(merged)]
+            merged.append(parameter)
+    return merged
 
 
 class SwaggerRegistry(Resource):
     def get(self):
+        generation = _current_generation()
+
+        @after_this_request
+        def add_generation_header(response):
+            response.headers["X-Spec-Generation"] = str(
+                _spec_generation(generation))
+            return response
+
         req_registry = _get_current_registry()
         if request.path.endswith(".html"):
             return render_homepage(req_registry["basePath"] +
                                    req_registry["spec_endpoint_path"] +
                                    "/_/resource_list.json")
-        return req_registry
+        path_prefix = request.args.get("path_prefix")
+        tag = request.args.get("tag")
+        if path_prefix is not None or tag is not None:
+            req_registry = _filter_spec(
+                generation, req_registry, ("spec", path_prefix, tag),
+                lambda index: index.find(path_prefix, tag))
+        return _json_response(
+            (generation, "spec", req_registry["basePath"], path_prefix, tag),
+            req_registry)
 
 
 def operation(**kwargs):
@@ -397,7 +1272,11 @@ def operation(**kwargs):
 
 
 def model(c=None, *args, **kwargs):
-    add_model(c)
+    if lazy_models:
+        with registry.lock:
+            _pending_models.append(c)
+    else:
+        add_model(c)
     return c
 
 
@@ -430,9 +1309,21 @@ def nested(klass=None, **kwargs):
 
 
 def add_model(model_class):
-    models = registry["models"]
+    with _timed(signals.model_added, model_class), \
+            _profiling("model", model_class):
+        model = _build_model(model_class)
+        # Publish a copy, so that readers never see a half built model
+        with registry.lock:
+            models = dict(registry["models"])
+            action = "changed" if model["id"] in models else "added"
+            models[model["id"]] = model
+            registry.publish("models", models,
+                             changes=[{"action": action, "model": model}])
+
+
+def _build_model(model_class):
     name = model_class.__name__
-    model = models[name] = {"id": name}
+    model = {"id": name}
     model["description"], model["notes"] = _parse_doc(model_class)
     if "resource_fields" in dir(model_class):
         # We take special care when a model class has a field resource_fields.
@@ -456,25 +1347,20 @@ def add_model(model_class):
                 field_type, nested_type)
     elif "__init__" in dir(model_class):
         # Alternatively, if a resource_fields does not exist, we deduce the
-        # model fields from the parameters sent to its __init__ method
+        # model fields from the parameters sent to its __init__ method (or
+        # from the fields of a dataclass)
 
-        # Credits for this snippet go to Robin Walsh
+        # Credits for the original snippet go to Robin Walsh
         # https://github.com/hobbeswalsh/flask-sillywalk
-        argspec = inspect.getargspec(model_class.__init__)
-        argspec.args.remove("self")
-        defaults = {}
         required = model["required"] = []
-        if argspec.defaults:
-            defaults = list(
-                zip(argspec.args[-len(argspec.defaults):], argspec.defaults))
         properties = model["properties"] = {}
-        required_args_count = len(argspec.args) - len(defaults)
-        for arg in argspec.args[:required_args_count]:  # type: str
-            # str for lack of better knowledge, until we add more metadata
-            required.append(arg)
-            properties[arg] = {"type": "string"}
-        for k, v in defaults:
-            properties[k] = {"type": "string", "default": v}
+        for arg, annotation, is_required, default in _model_arguments(
+                model_class):
+            if is_required:
+                required.append(arg)
+            properties[arg] = _annotation_property(annotation)
+            if default is not _no_default:
+                properties[arg]["default"] = default
 
     if "swagger_metadata" in dir(model_class):
         for field_name, field_metadata in model_class.swagger_metadata.items():
@@ -483,86 +1369,298 @@ def add_model(model_class):
                 # properties[field_name] = dict(properties[field_name].items() + field_metadata.items())   # noqa
                 properties[field_name].update(field_metadata)
 
+    return model
+
+
+# Stands for the type of fields.Nested, which is given by the nested model
+_nested_type = object()
+
+# The swagger type of python types and flask-restful fields, looked up along
+# the MRO, so subclasses get the type of their closest registered base (and
+# bool isn't taken for an int)
+_swagger_types = {
+    fields.String: "string",
+    fields.FormattedString: "string",
+    fields.Url: "string",
+    bool: "boolean",
+    fields.Boolean: "boolean",
+    int: "integer",
+    fields.Integer: "integer",
+    float: "number",
+    fields.Float: "number",
+    fields.Arbitrary: "number",
+    fields.Fixed: "number",
+    fields.DateTime: "date-time",
+    fields.List: "array",
+    fields.Nested: _nested_type,
+}
+_swagger_types.update(dict.fromkeys(six.string_types, "string"))
+_swagger_types.update(dict.fromkeys(six.integer_types, "integer"))
+
+# Swagger type of each class looked up so far, None when it has none
+_swagger_type_cache = {}
+
+
+def register_swagger_type(python_type, swagger_type):
+    """
+  Documents python_type (a type or a flask-restful field class, typically a
+  custom fields.Raw subclass) and its subclasses as swagger_type, e.g.
+  register_swagger_type(EmailField, "string").
+  """
+    _swagger_types[python_type] = swagger_type
+    _swagger_type_cache.clear()
 
-def deduce_swagger_type(python_type_or_object, nested_type=None):
-    import inspect
 
+def _swagger_type(python_type_or_object):
     if inspect.isclass(python_type_or_object):
-        predicate = issubclass
+        cls = python_type_or_object
     else:
-        predicate = isinstance
-    if predicate(
-            python_type_or_object,
-            six.string_types + (
-                fields.String,
-                fields.FormattedString,
-                fields.Url,
-                int,
-                fields.Integer,
-                float,
-                fields.Float,
-                fields.Arbitrary,
-                fields.Fixed,
-                bool,
-                fields.Boolean,
-                fields.DateTime,
-            ),
-    ):
-        return {"type": deduce_swagger_type_flat(python_type_or_object)}
-    if predicate(python_type_or_object, (fields.List)):
-        if inspect.isclass(python_type_or_object):
-            return {"type": "array"}
-        else:
-            return {
-                "type": "array",
-                "items": {
-                    "$ref":
-                    deduce_swagger_type_flat(python_type_or_object.container,
-                                             nested_type)
-                },
-            }
-    if predicate(python_type_or_object, (fields.Nested)):
-        return {"type": nested_type}
+        cls = type(python_type_or_object)
+    try:
+        return _swagger_type_cache[cls]
+    except KeyError:
+        pass
+    swagger_type = None
+    for base in inspect.getmro(cls):
+        if base in _swagger_types:
+            swagger_type = _swagger_types[base]
+            break
+    _swagger_type_cache[cls] = swagger_type
+    return swagger_type
+
+
+# Marks an __init__ argument without a default value
+_no_default = object()
+
+# The arguments of the __init__ of each model class, by class
+_model_arguments_cache = {}
+
+_array_types = (list, tuple, set, frozenset)
+
+
+def _type_hints(obj):
+    # Resolves string annotations (from __future__ import annotations)
+    if typing is None:
+        return {}
+    try:
+        return typing.get_type_hints(obj)
+    except Exception:
+        # Annotations that don't resolve are left as they are
+        return {}
+
+
+def _dataclass_arguments(model_class):
+    hints = _type_hints(model_class)
+    arguments = []
+    for field in dataclasses.fields(model_class):
+        if not field.init:
+            continue
+        has_factory = field.default_factory is not dataclasses.MISSING
+        has_default = field.default is not dataclasses.MISSING
+        arguments.append((
+            field.name,
+            hints.get(field.name, field.type),
+            not (has_default or has_factory),
+            field.default if has_default else _no_default,
+        ))
+    return arguments
+
+
+def _signature_arguments(init):
+    hints = _type_hints(init)
+    try:
+        parameters = list(inspect.signature(init).parameters.values())
+    except ValueError:
+        # Builtin __init__ without a signature
+        parameters = []
+    arguments = []
+    for parameter in parameters[1:]:
+        if parameter.kind in (parameter.VAR_POSITIONAL,
+                              parameter.VAR_KEYWORD):
+            continue
+        annotation = parameter.annotation
+        if annotation is parameter.empty:
+            annotation = None
+        has_default = parameter.default is not parameter.empty
+        arguments.append((
+            parameter.name,
+            hints.get(parameter.name, annotation),
+            not has_default,
+            parameter.default if has_default else _no_default,
+        ))
+    return arguments
+
+
+def _argspec_arguments(init):  # no cover
+    # python 2 has neither signatures nor annotations
+    argspec = inspect.getargspec(init)
+    args = argspec.args[1:]
+    defaults = argspec.defaults or ()
+    required_args_count = len(args) - len(defaults)
+    arguments = [(arg, None, True, _no_default)
+                 for arg in args[:required_args_count]]
+    arguments.extend((arg, None, False, default) for arg, default in zip(
+        args[required_args_count:], defaults))
+    return arguments
+
+
+def _model_arguments(model_class):
+    """
+  Returns the (name, annotation, required, default) of each argument of the
+  __init__ of model_class, without self. annotation is None when there is
+  none, default is _no_default when there is none. Each class is only
+  inspected once.
+  """
+    try:
+        return _model_arguments_cache[model_class]
+    except KeyError:
+        pass
+    init = model_class.__init__
+    if dataclasses is not None and dataclasses.is_dataclass(model_class):
+        arguments = _dataclass_arguments(model_class)
+    elif hasattr(inspect, "signature"):
+        arguments = _signature_arguments(init)
+    else:  # no cover
+        arguments = _argspec_arguments(init)
+    _model_arguments_cache[model_class] = arguments
+    return arguments
+
+
+def _annotation_property(annotation):
+    # The swagger property of an __init__ argument annotated with annotation
+    origin = getattr(annotation, "__origin__", None)
+    args = [arg for arg in getattr(annotation, "__args__", None) or ()
+            if arg is not type(None)]
+    if typing is not None and origin is typing.Union and len(args) == 1:
+        # Optional[...]
+        return _annotation_property(args[0])
+    if origin in _array_types or annotation in _array_types or (
+            typing is not None and origin in (
+                getattr(typing, "List", None),
+                getattr(typing, "Set", None),
+                getattr(typing, "Tuple", None),
+            )):
+        return {
+            "type": "array",
+            "items": _annotation_property(args[0] if args else None),
+        }
+    if inspect.isclass(annotation):
+        swagger_type = _swagger_type(annotation)
+        if isinstance(swagger_type, six.string_types):
+            return {"type": swagger_type}
+    # str for lack of better knowledge
+    return {"type": "string"}
 
-    return {"type": "null"}
+
+@_profiled("deduce_swagger_type")
+def deduce_swagger_type(python_type_or_object, nested_type=None):
+    swagger_type = _swagger_type(python_type_or_object)
+    if swagger_type is _nested_type:
+        return {"type": nested_type}
+    if swagger_type == "array" and isinstance(python_type_or_object,
+                                              fields.List):
+        return {
+            "type": "array",
+            "items": {
+                "$ref":
+                deduce_swagger_type_flat(python_type_or_object.container,
+                                         nested_type)
+            },
+        }
+    return {"type": swagger_type or "null"}
 
 
 def deduce_swagger_type_flat(python_type_or_object, nested_type=None):
     if nested_type:
         return nested_type
-    import inspect
-
-    if inspect.isclass(python_type_or_object):
-        predicate = issubclass
-    else:
-        predicate = isinstance
-    if predicate(
-            python_type_or_object,
-            six.string_types + (
-                fields.String,
-                fields.FormattedString,
-                fields.Url,
-            ),
-    ):
-        return "string"
-    if predicate(python_type_or_object, (bool, fields.Boolean)):
-        return "boolean"
-    if predicate(python_type_or_object, (int, fields.Integer)):
-        return "integer"
-    # yapf: disable
-    if predicate(
-        python_type_or_object,
-        (
-            float,
-            fields.Float,
-            fields.Arbitrary,
-            fields.Fixed,
-        ),
-    ):
-        return "number"
-    # yapf: enable
-    if predicate(python_type_or_object, (fields.DateTime)):
-        return "date-time"
+    swagger_type = _swagger_type(python_type_or_object)
+    # Lists and nested fields are only typed with their items
+    if swagger_type == "array" or swagger_type is _nested_type:
+        return None
+    return swagger_type
+
+
+# The grammar of werkzeug's rule parser
+_rule_re = re.compile(
+    r"""
+    (?P<static>[^<]*)
+    <
+    (?:
+        (?P<converter>[a-zA-Z_][a-zA-Z0-9_]*)
+        (?:\((?P<args>.*?)\))?
+        \:
+    )?
+    (?P<variable>[a-zA-Z_][a-zA-Z0-9_]*)
+    >
+    """,
+    re.VERBOSE,
+)
+
+# Swagger dataTypes of werkzeug's builtin converters, others are kept as is
+_converter_types = {
+    "default": "string",
+    "string": "string",
+    "any": "string",
+    "path": "string",
+    "uuid": "string",
+    "int": "integer",
+    "float": "number",
+}
+
+# Converters that can't match the {argument} of a swagger path, other
+# (custom) converters are assumed to
+_typed_converters = ("int", "float", "uuid", "any")
+
+# (swagger path, path arguments, whether the rule matches its help urls) of
+# each flask rule parsed so far
+_path_cache = {}
+
+
+def _parse_rule(rule):
+    if parse_rule is not None:
+        return parse_rule(rule)
+    parts = []
+    end = 0
+    for match in _rule_re.finditer(rule):
+        if match.group("static"):
+            parts.append((None, None, match.group("static")))
+        parts.append((match.group("converter") or "default",
+                      match.group("args"), match.group("variable")))
+        end = match.end()
+    if end < len(rule):
+        parts.append((None, None, rule[end:]))
+    return parts
+
+
+@_profiled("parse_path")
+def _parse_path(path):
+    parsed = _path_cache.get(path)
+    if parsed is None:
+        swagger_path, arguments = [], []
+        # The rule matches {swagger path}.help.json (or .help.html) when
+        # each of its arguments matches its {argument}, and the last one can
+        # take in ".help" too (whatever follows it is then at the end of both)
+        shadows_help, tail = False, ""
+        for converter, _, variable in _parse_rule(path):
+            if converter is None:
+                swagger_path.append(variable)
+                tail += variable
+                continue
+            swagger_path.append("{%s}" % variable)
+            arguments.append({
+                "name": variable,
+                "dataType": _converter_types.get(converter, converter),
+                "paramType": "path",
+            })
+            shadows_help = converter not in _typed_converters and (
+                shadows_help or len(arguments) == 1)
+            tail = ""
+        shadows_help = shadows_help and "/" not in tail and any(
+            (tail + suffix).endswith(tail)
+            for suffix in (".help.json", ".help.html"))
+        parsed = _path_cache[path] = (
+            "".join(swagger_path), arguments, shadows_help)
+    return parsed
 
 
 def extract_swagger_path(path):
@@ -572,7 +1670,7 @@ def extract_swagger_path(path):
   And this /<string(length=2):lang_code>/<string:id>/<float:probability>
   to this: /{lang_code}/{id}/{probability}
   """
-    return re.sub("<(?:[^:]+:)?([^>]+)>", "{\\1}", path)
+    return _parse_path(path)[0]
 
 
 def extract_path_arguments(path):
@@ -583,17 +1681,7 @@ def extract_path_arguments(path):
   extracts: [
     {name: 'lang_code', dataType: 'string'},
     {name: 'id', dataType: 'string'}
-    {name: 'probability', dataType: 'float'}]
+    {name: 'probability', dataType: 'number'}]
   """
-    # Remove all parentheses
-    path = re.sub(r"\([^)]*\)", "", path)
-    args = re.findall("<([^>]+)>", path)
-
-    def split_arg(arg):
-        spl = arg.split(":")
-        if len(spl) == 1:
-            return {"name": spl[0], "dataType": "string", "paramType": "path"}
-        else:
-            return {"name": spl[1], "dataType": spl[0], "paramType": "path"}
-
-    return list(map(split_arg, args))
+    # Copies, the cached arguments are shared by every caller
+    return [dict(argument) for argument in _parse_path(path)[1]]
@@ -0,0 +1,50 @@
+"""
+A WSGI middleware serving the docs of a Flask app from memory.
+
+The doc urls are recognized by their prefix, and answered from the documents
+rendered once through the app, skipping its url matching, request context,
+hooks and flask-restful dispatch:
+
+    from flask_restful_swagger.wsgi import SwaggerDocsMiddleware
+
+    app.wsgi_app = SwaggerDocsMiddleware(app, app.wsgi_app)
+"""
+from flask_restful_swagger.export import RENDERING, DocumentCache
+
+
+class SwaggerDocsMiddleware(object):
+    """
+    Answers the requests for the documents of flask_app, and passes any
+    other request to wsgi_app, flask_app.wsgi_app by default.
+    """
+
+    def __init__(self, flask_app, wsgi_app=None, maxsize=1024):
+        self.documents = DocumentCache(flask_app, maxsize)
+        self.wsgi_app = wsgi_app or flask_app.wsgi_app
+
+    def __call__(self, environ, start_response):
+        if environ["REQUEST_METHOD"] in ("GET", "HEAD") and \
+                not environ.get(RENDERING):
+            document = self._document(environ)
+            if document is not None:
+                status, headers, body = document
+                start_response(status, headers)
+                return [] if environ["REQUEST_METHOD"] == "HEAD" else [body]
+        return self.wsgi_app(environ, start_response)
+
+    def _document(self, environ):
+        path = environ.get("PATH_INFO", "") or "/"
+        if not self.documents.serves(path):
+            return None
+        headers = dict(
+            (key[len("HTTP_"):].replace("_", "-").lower(), value)
+            for key, value in environ.items() if key.startswith("HTTP_")
+        )
+        host = headers.get("host")
+        if host is None:
+            host = "{0}:{1}".format(
+                environ["SERVER_NAME"], environ["SERVER_PORT"])
+        base_url = "{0}://{1}{2}".format(
+            environ["wsgi.url_scheme"], host, environ.get("SCRIPT_NAME", ""))
+        return self.documents.respond(
+            path, base_url, environ.get("QUERY_STRING", ""), headers)
@@ -0,0 +1,11 @@
+#!/bin/bash
+
+benchmarks() {
+
+  set -e
+
+  pushd "${PROJECT_HOME}"  > /dev/null
+    pytest benchmarks "$@"
+  popd  > /dev/null
+
+}
@@ -15,8 +15,15 @@ source "$( dirname "${BASH_SOURCE[0]}" )/common/common.sh"
 # source "$( dirname "${BASH_SOURCE[0]}" )/common/wheel.sh"
 
 # Add Additional Functionality Via Imports Here
+# shellcheck source=scripts/benchmark.sh
+source "$( dirname "${BASH_SOURCE[0]}" )/benchmark.sh"
 
 case $1 in
+  'benchmark')
+    shift
+    source_enviroment
+    benchmarks "$@"
+    ;;
   'lint')
     shift
     source_enviroment
@@ -43,7 +50,7 @@ case $1 in
     setup_python "$@"
     ;;
   'shortlist')
-    echo "lint lint-validate reinstall-requirements sectest setup test test-coverage"
+    echo "benchmark lint lint-validate reinstall-requirements sectest setup test test-coverage"
     ;;
   'test')
     shift
@@ -57,6 +64,7 @@ case $1 in
     ;;
   *)
     echo "Valid Commands:"
+    echo ' - benchmark               (Run the benchmarks)'
     echo ' - lint                    (Run the linter)'
     echo ' - lint-validate           (Validate linting)'
     echo ' - reinstall-requirements  (Reinstall Packages'
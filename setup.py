@@ -29,4 +29,13 @@ setup(
         "Jinja2>=2.10.1,<3.0.0",
         "Flask-RESTful>=0.3.6",
     ],
+    extras_require={
+        "brotli": ["brotli"],
+        "signals": ["blinker"],
+    },
+    entry_points={
+        "flask.commands": [
+            "swagger=flask_restful_swagger.cli:swagger",
+        ],
+    },
 )
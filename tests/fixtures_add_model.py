@@ -8,16 +8,14 @@ from contextlib import contextmanager
 
 from flask_restful import fields
 
-from flask_restful_swagger import swagger
+from flask_restful_swagger import Registry, swagger
 
 
 @contextmanager
 def patch_registry():
-    with patch("flask_restful_swagger.swagger.registry") as mock_registry:
-        _temp_dict = {"models": {}}
-        mock_registry.__getitem__.side_effect = _temp_dict.__getitem__
-        mock_registry.__setitem__.side_effect = _temp_dict.__setitem__
-        yield _temp_dict
+    _temp_registry = Registry(models={})
+    with patch("flask_restful_swagger.swagger.registry", _temp_registry):
+        yield _temp_registry
 
 
 @contextmanager
@@ -58,15 +56,16 @@ def patch_dir(patchreturn):
 
 
 @contextmanager
-def patch_getargspec():
+def patch_model_arguments():
     with patch(
-        "flask_restful_swagger.swagger.inspect.getargspec"
-    ) as mock_getargspec:
-        mock_argspec = Mock()
-        mock_argspec.args = ["self", "arg1", "arg2", "arg3"]
-        mock_argspec.defaults = ("123",)
-        mock_getargspec.return_value = mock_argspec
-        yield mock_getargspec
+        "flask_restful_swagger.swagger._model_arguments"
+    ) as mock_model_arguments:
+        mock_model_arguments.return_value = [
+            ("arg1", None, True, swagger._no_default),
+            ("arg2", None, True, swagger._no_default),
+            ("arg3", None, False, "123"),
+        ]
+        yield mock_model_arguments
 
 
 ###############################################################################
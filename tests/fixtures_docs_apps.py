@@ -0,0 +1,123 @@
+import asyncio
+import itertools
+
+from flask import Blueprint, Flask
+from flask_restful import Api, Resource
+
+from flask_restful_swagger import swagger
+from flask_restful_swagger.asgi import SwaggerDocsApp
+from flask_restful_swagger.wsgi import SwaggerDocsMiddleware
+
+# The host the docs are requested from by the clients below
+HOST = "docs.example.com"
+
+
+class MockResource(Resource):
+    def get(self, todo_id=None):
+        return "OK"
+
+
+class OtherResource(Resource):
+    def get(self):
+        return "OK"
+
+
+class NamedResource(Resource):
+    def get(self, name):
+        return name
+
+
+# blueprint specs live in the module level registry, keyed by name
+_blueprint_ids = itertools.count()
+
+
+def make_app(**kwargs):
+    # An app documenting MockResource at /todos and /todos/<int:todo_id>
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), **kwargs)
+    api.add_resource(MockResource, "/todos", "/todos/<int:todo_id>")
+    return app, api
+
+
+def make_blueprint(**kwargs):
+    # A documented blueprint, with a name of its own
+    blueprint = Blueprint(
+        "fixture_blueprint_%d" % next(_blueprint_ids), __name__
+    )
+    return blueprint, swagger.docs(Api(blueprint), **kwargs)
+
+
+def asgi_client(flask_app, app=None):
+    """
+    Returns get(path, ...) -> (status, headers, body) requesting path from a
+    SwaggerDocsApp serving the docs of flask_app, in front of app. Header
+    names are lower case.
+    """
+    docs_app = SwaggerDocsApp(flask_app, app)
+
+    def get(path, method="GET", headers=None, query_string="",
+            root_path=""):
+        scope = {
+            "type": "http",
+            "method": method,
+            "scheme": "http",
+            "path": root_path + path,
+            "root_path": root_path,
+            "query_string": query_string.encode("latin-1"),
+            "headers": [(b"host", HOST.encode("latin-1"))] + [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in (headers or {}).items()
+            ],
+            "server": ("127.0.0.1", 8000),
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            messages.append(message)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(docs_app(scope, receive, send))
+        finally:
+            loop.close()
+        start, body = messages
+        return (
+            start["status"],
+            dict((name.decode("latin-1"), value.decode("latin-1"))
+                 for name, value in start["headers"]),
+            body["body"],
+        )
+
+    get.docs_app = docs_app
+    return get
+
+
+def wsgi_client(flask_app):
+    """
+    Like asgi_client, through a SwaggerDocsMiddleware wrapping flask_app,
+    which gets the requests for anything else.
+    """
+    flask_app.wsgi_app = SwaggerDocsMiddleware(flask_app, flask_app.wsgi_app)
+    client = flask_app.test_client()
+
+    def get(path, method="GET", headers=None, query_string="",
+            root_path=""):
+        response = client.open(
+            path,
+            method=method,
+            headers=headers or {},
+            query_string=query_string,
+            base_url="http://" + HOST + root_path,
+        )
+        return (
+            response.status_code,
+            dict((name.lower(), value)
+                 for name, value in response.headers.items()),
+            response.get_data(),
+        )
+
+    get.docs_app = flask_app.wsgi_app
+    return get
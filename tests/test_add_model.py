@@ -12,9 +12,9 @@ from tests.fixtures_add_model import (
     fixtures_integration_test_add_model,
     patch_deduce_swagger_type,
     patch_dir,
-    patch_getargspec,
     patch_hasattr,
     patch_isinstance,
+    patch_model_arguments,
     patch_parse_doc,
     patch_registry,
 )
@@ -201,14 +201,14 @@ def test_add_model_init(model_class):
     pdst = patch_deduce_swagger_type
     pr = patch_registry
     ppd = patch_parse_doc
-    pgas = patch_getargspec
+    pma = patch_model_arguments
     pha = patch_hasattr
 
     with pdst() as mock_deduce_swagger_type:
-        with patch_dir(["__init__"]), pr(), ppd(), pgas() as mock_getargspec:
+        with patch_dir(["__init__"]), pr(), ppd(), pma() as mock_arguments:
             with pha() as mock_hasattr:
                 swagger.add_model(model_class)
-                mock_getargspec.assert_called_once_with(model_class.__init__)
+                mock_arguments.assert_called_once_with(model_class)
                 mock_hasattr.assert_not_called()
                 mock_deduce_swagger_type.assert_not_called()
 
@@ -225,14 +225,14 @@ def test_add_model_no_init(model_class):
     pdst = patch_deduce_swagger_type
     pr = patch_registry
     ppd = patch_parse_doc
-    pgas = patch_getargspec
+    pma = patch_model_arguments
     pha = patch_hasattr
 
     with pdst() as mock_deduce_swagger_type:
-        with pr(), ppd(), pgas() as mock_getargspec:
+        with pr(), ppd(), pma() as mock_arguments:
             with pha() as mock_hasattr:
                 swagger.add_model(model_class)
-                mock_getargspec.assert_not_called()
+                mock_arguments.assert_not_called()
                 mock_hasattr.assert_not_called()
                 mock_deduce_swagger_type.assert_not_called()
 
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+from .fixtures_docs_apps import asgi_client, make_app
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200,
+                "headers": []})
+    await send({"type": "http.response.body", "body": b"OK"})
+
+
+def test_other_requests_go_to_the_app():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["path"])
+        await ok_app(scope, receive, send)
+
+    get = asgi_client(make_app()[0], app)
+
+    assert get("/todos") == (200, {}, b"OK")
+    assert get("/api/spec.json", method="POST") == (200, {}, b"OK")
+    assert get("/api/spec/_/changes")[2] == b"OK"
+    assert get("/api/spec.json")[2] != b"OK"
+    assert calls == ["/todos", "/api/spec.json", "/api/spec/_/changes"]
+
+
+def test_not_found():
+    get = asgi_client(make_app()[0])
+
+    assert get("/todos")[0] == 404
+
+
+def test_renders_off_the_event_loop():
+    flask_app, _ = make_app()
+    rendered = []
+    flask_app.before_request(
+        lambda: rendered.append(threading.current_thread()))
+    get = asgi_client(flask_app)
+
+    first = get("/api/spec.json")
+    assert get("/api/spec.json") == first
+
+    assert len(rendered) == 1
+    assert rendered[0] is not threading.current_thread()
+
+
+def run(app, scope, *received):
+    messages = []
+    received = list(received)
+
+    async def receive():
+        return received.pop(0)
+
+    async def send(message):
+        messages.append(message)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(app(scope, receive, send))
+    finally:
+        loop.close()
+    return messages
+
+
+def test_websocket_without_app():
+    app = asgi_client(make_app()[0]).docs_app
+
+    messages = run(app, {"type": "websocket", "path": "/socket"},
+                   {"type": "websocket.connect"})
+
+    assert messages == [{"type": "websocket.close", "code": 1000}]
+
+
+def test_lifespan_without_app():
+    app = asgi_client(make_app()[0]).docs_app
+
+    messages = run(app, {"type": "lifespan"},
+                   {"type": "lifespan.startup"},
+                   {"type": "lifespan.shutdown"})
+
+    assert messages == [
+        {"type": "lifespan.startup.complete"},
+        {"type": "lifespan.shutdown.complete"},
+    ]
@@ -87,3 +87,27 @@ def test_deduce_swagger_type_fields_nested_instance():
     new_instance = fields.Nested({})
 
     assert swagger.deduce_swagger_type(new_instance) == {"type": None}
+
+
+def test_deduce_swagger_type_registered_field():
+    class EmailField(fields.Raw):
+        pass
+
+    class WorkEmailField(EmailField):
+        pass
+
+    assert swagger.deduce_swagger_type(WorkEmailField()) == {"type": "null"}
+
+    swagger.register_swagger_type(EmailField, "string")
+
+    assert swagger.deduce_swagger_type(WorkEmailField()) == {"type": "string"}
+    assert swagger.deduce_swagger_type_flat(WorkEmailField) == "string"
+
+
+def test_deduce_swagger_type_follows_mro():
+    class Flag(fields.Boolean, fields.Integer):
+        pass
+
+    assert swagger.deduce_swagger_type(Flag()) == {"type": "boolean"}
+    assert swagger.deduce_swagger_type(fields.List) == {"type": "array"}
+    assert swagger.deduce_swagger_type_flat(fields.List(fields.String)) is None
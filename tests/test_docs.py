@@ -34,7 +34,7 @@ def test_docs_simple_instantiate():
 
 @patch("flask_restful_swagger.swagger.register_once")
 @patch("flask_restful_swagger.swagger.make_class")
-@patch("flask_restful_swagger.swagger.swagger_endpoint")
+@patch("flask_restful_swagger.swagger._register_endpoint")
 @patch("flask_restful_swagger.swagger.extract_swagger_path")
 def test_docs_simple_instantiate_add_resources(
     path, endpoint, make_class, register
@@ -49,7 +49,6 @@ def test_docs_simple_instantiate_add_resources(
             return "OK", 200, {"Access-Control-Allow-Origin": "*"}
 
     make_class.return_value = MockResource
-    endpoint.return_value = MockResource
     path.return_value = "/some/swagger/path"
 
     api1.add_resource(MockResource, "/some/url")
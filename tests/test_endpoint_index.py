@@ -0,0 +1,92 @@
+from flask_restful_swagger.swagger import EndpointIndex, referenced_models
+
+
+def make_endpoint(path, *tags):
+    operation = {"method": "get", "tags": list(tags)}
+    return {"path": path, "operations": [operation]}
+
+
+def test_endpoint_index_find_by_path_prefix():
+    index = EndpointIndex()
+    endpoints = [
+        make_endpoint("/todos/{todo_id}"),
+        make_endpoint("/users"),
+        make_endpoint("/todos"),
+        make_endpoint("/todos_archive"),
+        make_endpoint("/todos/{todo_id}/items"),
+    ]
+    for endpoint in endpoints:
+        index.add(endpoint)
+
+    assert index.find("/todos") == [endpoints[0], endpoints[2], endpoints[4]]
+    assert index.find("/todos/") == index.find("/todos")
+    assert index.find("/todos/{todo_id}/items") == [endpoints[4]]
+    assert index.find("/") == endpoints
+    assert index.find("/todo") == []
+
+
+def test_endpoint_index_find_by_tag():
+    index = EndpointIndex()
+    todos = make_endpoint("/todos", "todos")
+    billing = make_endpoint("/todos/billing", "todos", "billing")
+    invoice = {
+        "path": "/invoice",
+        "operations": [
+            {"method": "get"},
+            {"method": "put", "tags": "billing"},
+        ],
+    }
+    for endpoint in [todos, billing, invoice]:
+        index.add(endpoint)
+
+    assert index.find(tag="todos") == [todos, billing]
+    assert index.find(tag="billing") == [billing, invoice]
+    assert index.find("/todos", tag="billing") == [billing]
+    assert index.find(tag="missing") == []
+
+
+def test_endpoint_index_extended():
+    index = EndpointIndex()
+    todos = make_endpoint("/todos", "todos")
+    todo = make_endpoint("/todos/{todo_id}", "todos")
+    for endpoint in [todos, todo]:
+        index.add(endpoint)
+    items = make_endpoint("/todos/{todo_id}/items", "todos")
+    users = make_endpoint("/users", "users")
+
+    extended = index.extended([items, users])
+
+    assert index.find("/todos") == [todos, todo]
+    assert index.find(tag="todos") == [todos, todo]
+    assert index.group_names() == ["todos"]
+    assert extended.find("/todos") == [todos, todo, items]
+    assert extended.find(tag="todos") == [todos, todo, items]
+    assert extended.find("/users") == [users]
+    assert extended.group_names() == ["todos", "users"]
+
+    extended.extended([make_endpoint("/todos/done", "todos")])
+    assert extended.find(tag="todos") == [todos, todo, items]
+
+
+def test_referenced_models():
+    models = {
+        "Todo": {"id": "Todo", "properties": {"owner": {"type": "User"}}},
+        "User": {
+            "id": "User",
+            "properties": {"groups": {"type": "array",
+                                      "items": {"$ref": "Group"}}},
+        },
+        "Group": {"id": "Group", "properties": {}},
+        "Unused": {"id": "Unused", "properties": {}},
+    }
+    apis = [{
+        "path": "/todos",
+        "operations": [{
+            "method": "get",
+            "responseClass": "Todo",
+            "parameters": [{"name": "body", "dataType": "string"}],
+        }],
+    }]
+
+    assert sorted(referenced_models(apis, models)) == ["Group", "Todo", "User"]
+    assert referenced_models([], models) == {}
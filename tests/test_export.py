@@ -0,0 +1,103 @@
+import json
+import os
+import shutil
+import tempfile
+
+from flask_restful_swagger.cli import swagger as swagger_cli
+from flask_restful_swagger.export import document_urls, export_docs
+from .fixtures_docs_apps import MockResource, make_app, make_blueprint
+
+
+def make_export_app():
+    # An app with a documented blueprint too
+    app, _ = make_app()
+    blueprint, blueprint_api = make_blueprint(api_spec_url="/spec")
+    blueprint_api.add_resource(MockResource, "/items")
+    app.register_blueprint(blueprint, url_prefix="/v2")
+    return app
+
+
+def test_document_urls():
+    urls = document_urls(make_export_app())
+
+    for url in [
+        "/api/spec.json",
+        "/api/spec.html",
+        "/api/spec/_/resource_list.json",
+        "/api/spec/_/static/index.html",
+        "/api/spec/_/static/css/screen.css",
+        "/todos.help.json",
+        "/todos/{todo_id}.help.html",
+        "/v2/spec.json",
+        "/v2/spec/_/static/swagger-ui.js",
+        "/v2/items.help.json",
+    ]:
+        assert url in urls
+
+
+def test_document_urls_split_resources():
+    app, api = make_app(split_resources=True, lazy=True)
+    api.add_resource(MockResource, "/", endpoint="root")
+
+    urls = document_urls(app)
+
+    assert "/todos/{todo_id}.help.json" in urls
+    assert "/api/spec/_/resources/todos" in urls
+    assert "/api/spec/_/resources/_" in urls
+
+
+def test_export_docs():
+    directory = tempfile.mkdtemp()
+    try:
+        written = export_docs(
+            make_export_app(), directory, base_url="https://docs.example.com"
+        )
+
+        assert len(written) == len(set(written))
+        with open(os.path.join(directory, "api", "spec.json")) as fs:
+            spec = json.load(fs)
+        assert spec["basePath"] == "https://docs.example.com"
+        assert [api["path"] for api in spec["apis"]] == [
+            "/todos",
+            "/todos/{todo_id}",
+        ]
+        help_file = os.path.join(directory, "todos", "{todo_id}.help.json")
+        with open(help_file) as fs:
+            assert json.load(fs)["path"] == "/todos/{todo_id}"
+        # The UI loads the spec from the path of the listing
+        for spec_url in ["api/spec", "v2/spec"]:
+            listing_file = os.path.join(
+                directory, spec_url, "_", "resource_list.json"
+            )
+            with open(listing_file) as fs:
+                paths = [api["path"] for api in json.load(fs)["apis"]]
+            assert paths == ["https://docs.example.com/" + spec_url + ".json"]
+            assert os.path.isfile(os.path.join(
+                directory, paths[0][len("https://docs.example.com/"):]))
+        # The UI page loads the written listing
+        for spec_url in ["api/spec", "v2/spec"]:
+            index_file = os.path.join(
+                directory, spec_url, "_", "static", "index.html"
+            )
+            with open(index_file) as fs:
+                page = fs.read()
+            assert "https://docs.example.com/" + spec_url + "/_/static/" in (
+                page
+            )
+            listing_url = "https://docs.example.com/{0}/_/resource_list.json"
+            assert 'url: "{0}"'.format(listing_url.format(spec_url)) in page
+    finally:
+        shutil.rmtree(directory)
+
+
+def test_export_command():
+    directory = tempfile.mkdtemp()
+    try:
+        runner = make_export_app().test_cli_runner()
+        result = runner.invoke(swagger_cli, ["export", directory])
+
+        assert result.exit_code == 0, result.output
+        assert "Exported" in result.output
+        assert os.path.exists(os.path.join(directory, "api", "spec.json"))
+    finally:
+        shutil.rmtree(directory)
@@ -1,7 +1,12 @@
 import pytest
 
+from flask_restful_swagger import swagger
 from flask_restful_swagger.swagger import extract_path_arguments
-from .lib.helpers import find_nested_func
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
 
 
 @pytest.mark.parametrize(
@@ -36,7 +41,7 @@ from .lib.helpers import find_nested_func
                 },
                 {
                     "name": "probability",
-                    "dataType": "float",
+                    "dataType": "number",
                     "paramType": "path",
                 },
             ],
@@ -54,7 +59,7 @@ from .lib.helpers import find_nested_func
                 },
                 {
                     "name": "identifier",
-                    "dataType": "float",
+                    "dataType": "number",
                     "paramType": "path",
                 },
                 {
@@ -71,10 +76,10 @@ def test_extract_path(path, expected):
 
 
 @pytest.mark.parametrize(
-    "arg,expected",
+    "path,expected",
     [
         (
-            "not_declared",
+            "/<not_declared>",
             {
                 "name": "not_declared",
                 "dataType": "string",
@@ -82,15 +87,41 @@ def test_extract_path(path, expected):
             },
         ),
         (
-            "int:identifier",
-            {"name": "identifier", "dataType": "int", "paramType": "path"},
+            "/<int:identifier>",
+            {"name": "identifier", "dataType": "integer", "paramType": "path"},
         ),
         (
-            "float:amount",
-            {"name": "amount", "dataType": "float", "paramType": "path"},
+            "/<float:amount>",
+            {"name": "amount", "dataType": "number", "paramType": "path"},
+        ),
+        (
+            "/<path:file_path>",
+            {"name": "file_path", "dataType": "string", "paramType": "path"},
         ),
     ],
 )
-def test_nested_split_args(arg, expected):
-    split_arg = find_nested_func(extract_path_arguments, "split_arg")
-    assert split_arg(arg) == expected
+def test_converter_data_types(path, expected):
+    assert extract_path_arguments(path) == [expected]
+
+
+@pytest.mark.parametrize("path", ["/a/<int:b>/c", "/<string(length=2):d>"])
+def test_extract_path_without_werkzeug_parser(path):
+    expected = (
+        swagger.extract_swagger_path(path), extract_path_arguments(path)
+    )
+    with patch("flask_restful_swagger.swagger.parse_rule", None), patch(
+        "flask_restful_swagger.swagger._path_cache", {}
+    ):
+        assert swagger.extract_swagger_path(path) == expected[0]
+        assert extract_path_arguments(path) == expected[1]
+
+
+def test_extract_path_is_cached():
+    path = "/cached/<int:identifier>"
+    arguments = extract_path_arguments(path)
+    arguments[0]["dataType"] = "changed"
+
+    with patch("flask_restful_swagger.swagger.parse_rule") as parse:
+        assert extract_path_arguments(path)[0]["dataType"] == "integer"
+        assert swagger.extract_swagger_path(path) == "/cached/{identifier}"
+        assert not parse.called
@@ -3,6 +3,7 @@ import sys
 from flask import Blueprint, Flask
 from flask_restful import Api, Resource
 
+import flask_restful_swagger
 from flask_restful_swagger import swagger
 from flask_restful_swagger.swagger import _get_current_registry
 from .lib.helpers import TestCaseSupport
@@ -119,3 +120,32 @@ def test_get_current_registry_request_features_and_docs():
         registry,
         {"basePath": "http://localhost", "models": {}}
     )
+
+
+def test_get_current_registry_does_not_mutate_registry():
+    app = Flask(__name__)
+    blueprint = Blueprint("prefixed_blueprint", __name__)
+    api = swagger.docs(Api(blueprint), basePath="http://localhost:5000")
+
+    class MockResource(Resource):
+        def get(self):
+            return "OK"
+
+    api.add_resource(MockResource, "/some/urls")
+    app.register_blueprint(blueprint, url_prefix="/v1")
+
+    shared = flask_restful_swagger.registry["prefixed_blueprint"]
+    before = dict(shared)
+
+    for _ in range(3):
+        with app.test_request_context(path="/v1/api/spec.json"):
+            registry = _get_current_registry()
+        assert registry["basePath"] == "http://localhost/v1"
+        assert registry["models"] is flask_restful_swagger.registry["models"]
+
+    for _ in range(3):
+        registry = _get_current_registry(api=api)
+        assert registry["basePath"] == "http://localhost:5000/v1"
+
+    assert shared == before
+    assert "models" not in shared
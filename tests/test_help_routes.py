@@ -0,0 +1,113 @@
+import pytest
+
+from flask_restful_swagger import swagger
+from .fixtures_docs_apps import (
+    MockResource,
+    NamedResource,
+    make_app,
+    make_blueprint,
+)
+
+
+def make_help_app(**kwargs):
+    app, api = make_app(**kwargs)
+    api.add_resource(MockResource, "/", endpoint="root")
+    api.add_resource(NamedResource, "/names/<string:name>")
+    return app
+
+
+def test_one_help_route():
+    app = make_help_app()
+
+    rules = [rule.rule for rule in app.url_map.iter_rules()
+             if rule.endpoint == "app/help"]
+    assert len(rules) == 2
+    assert not [rule for rule in app.url_map.iter_rules()
+                if rule.rule.startswith("/todos") and "help" in rule.rule]
+    # /names/<string:name> would match /names/{name}.help.json before the
+    # help route does
+    assert [rule.rule for rule in app.url_map.iter_rules()
+            if rule.endpoint == "/names/{name}/help"] == [
+        "/names/{name}.help.<any(json, html):ext>"]
+
+    with app.test_client() as client:
+        for path in ["/todos", "/todos/{todo_id}", "/names/{name}", "/"]:
+            response = client.get(path.rstrip("/") + "/.help.json"
+                                  if path == "/" else path + ".help.json")
+            assert response.get_json()["path"] == path
+        response = client.get("/todos/{todo_id}.help.html")
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/html")
+        assert client.get("/missing.help.json").status_code == 404
+        assert client.get("/todos.help.xml").status_code == 404
+        assert client.get("/names/joe").get_json() == "joe"
+
+
+def test_blueprint_help_route():
+    app = make_help_app()
+    blueprint, api = make_blueprint(api_spec_url="/spec")
+    api.add_resource(MockResource, "/items")
+    api.add_resource(NamedResource, "/items/<name>")
+    app.register_blueprint(blueprint, url_prefix="/v2")
+
+    with app.test_client() as client:
+        response = client.get("/v2/items.help.json")
+        assert response.get_json()["path"] == "/items"
+        response = client.get("/v2/items/{name}.help.json")
+        assert response.get_json()["path"] == "/items/{name}"
+        assert client.get("/v2/todos.help.json").status_code == 404
+
+
+def test_help_route_of_an_html_url():
+    app, api = make_app()
+    api.add_resource(NamedResource, "/pages/<name>.html")
+
+    with app.test_client() as client:
+        response = client.get("/pages/{name}.html.help.html")
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/html")
+        response = client.get("/pages/{name}.html.help.json")
+        assert response.get_json()["path"] == "/pages/{name}.html"
+        assert client.get("/pages/joe.html").get_json() == "joe"
+
+
+def test_lazy_help_route():
+    app = make_help_app(lazy=True)
+
+    with app.test_client() as client:
+        response = client.get("/todos/{todo_id}.help.json")
+
+    assert response.get_json()["path"] == "/todos/{todo_id}"
+
+
+def test_help_routes_disabled():
+    app = make_help_app(help_routes=False)
+
+    assert not [rule for rule in app.url_map.iter_rules()
+                if "help" in rule.rule]
+    with app.test_client() as client:
+        assert client.get("/todos.help.json").status_code == 404
+        spec = client.get("/api/spec.json").get_json()
+
+    assert [api["path"] for api in spec["apis"]] == [
+        "/todos", "/todos/{todo_id}", "/", "/names/{name}"]
+
+
+@pytest.mark.parametrize(
+    "url, shadows",
+    [
+        ("/todos", False),
+        ("/todos/<int:todo_id>", False),
+        ("/todos/<todo_id>", True),
+        ("/names/<string:name>", True),
+        ("/files/<path:name>", True),
+        ("/names/<name>.json", True),
+        ("/names/<name>.html", True),
+        ("/names/<name>.xml", False),
+        ("/names/<name>/items", False),
+        ("/todos/<int:todo_id>/<name>", False),
+        ("/tags/<custom:tag>", True),
+    ],
+)
+def test_shadows_help(url, shadows):
+    assert swagger._shadows_help(url) == shadows
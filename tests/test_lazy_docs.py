@@ -0,0 +1,133 @@
+import threading
+import time
+
+from flask import Flask
+from flask_restful import Api, Resource
+
+from flask_restful_swagger import Registry, swagger
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+
+class MockResource(Resource):
+    def get(self):
+        return "OK"
+
+
+def test_lazy_docs_builds_on_first_doc_request():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), lazy=True)
+
+    with patch(
+        "flask_restful_swagger.swagger.SwaggerEndpoint",
+        wraps=swagger.SwaggerEndpoint,
+    ) as endpoint:
+        api.add_resource(MockResource, "/first")
+        api.add_resource(MockResource, "/second", endpoint="second")
+        assert not endpoint.called
+
+        reg = app.extensions["flask-restful-swagger"]
+        assert "apis" not in reg["app"]
+        assert len(reg.pending) == 2
+
+        with app.test_client() as client:
+            assert client.get("/first").status_code == 200
+            assert not endpoint.called
+
+            spec = client.get("/api/spec.json").get_json()
+            assert [e["path"] for e in spec["apis"]] == ["/first", "/second"]
+            assert endpoint.call_count == 2
+
+            client.get("/api/spec.json")
+            assert endpoint.call_count == 2
+
+    assert reg.pending == []
+
+
+def test_lazy_docs_concurrent_first_requests():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), lazy=True)
+    api.add_resource(MockResource, "/first")
+    build_endpoints = swagger._build_endpoints
+    building = threading.Event()
+
+    def slow_build_endpoints(reg, registrations):
+        building.set()
+        time.sleep(0.1)
+        build_endpoints(reg, registrations)
+
+    specs = []
+
+    def get_spec():
+        with app.test_client() as client:
+            specs.append(client.get("/api/spec.json").get_json())
+
+    with patch("flask_restful_swagger.swagger._build_endpoints",
+               side_effect=slow_build_endpoints):
+        first = threading.Thread(target=get_spec)
+        first.start()
+        building.wait()
+        second = threading.Thread(target=get_spec)
+        second.start()
+        first.join()
+        second.join()
+
+    assert [[e["path"] for e in spec["apis"]] for spec in specs] == [
+        ["/first"], ["/first"]]
+
+
+def test_lazy_docs_generation_header():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), lazy=True)
+    api.add_resource(MockResource, "/first")
+
+    with app.test_client() as client:
+        response = client.get("/api/spec.json")
+        changes = client.get(
+            "/api/spec/_/changes?since="
+            + response.headers["X-Spec-Generation"]).get_json()
+
+    assert [e["path"] for e in response.get_json()["apis"]] == ["/first"]
+    assert changes["changes"] == []
+
+
+def test_lazy_docs_help_endpoint():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), lazy=True)
+    api.add_resource(MockResource, "/mock/<int:mock_id>")
+
+    with app.test_client() as client:
+        help_json = client.get("/mock/{mock_id}.help.json").get_json()
+
+    assert help_json["path"] == "/mock/{mock_id}"
+
+
+def test_warm_up():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), lazy=True)
+    api.add_resource(MockResource, "/mock")
+
+    swagger.warm_up(app)
+
+    reg = app.extensions["flask-restful-swagger"]
+    assert reg.pending == []
+    assert [e["path"] for e in reg["app"]["apis"]] == ["/mock"]
+
+
+@patch("flask_restful_swagger.swagger.lazy_models", True)
+@patch("flask_restful_swagger.swagger.registry", new_callable=Registry)
+def test_lazy_models(registry):
+    registry["models"] = {}
+
+    @swagger.model
+    class LazyModel(object):
+        resource_fields = {}
+
+    assert "LazyModel" not in registry["models"]
+
+    swagger.warm_up()
+
+    assert "LazyModel" in registry["models"]
@@ -124,3 +124,22 @@ def test_merge_parameter_list_appended(overrides, expected):
         },
     ]
     assert swagger.merge_parameter_list(base, overrides) == expected
+
+
+def test_merge_parameter_list_keyed_by_param_type():
+    path = {"name": "todo_id", "paramType": "path", "dataType": "string"}
+    documented = {"name": "todo_id", "paramType": "path", "dataType": "int"}
+    body = {"name": "todo_id", "paramType": "body"}
+    query = {"name": "q", "paramType": "query"}
+
+    merged = swagger.merge_parameter_list([path], [body, documented, query])
+
+    assert merged == [documented, body, query]
+    assert merged[1] is body
+
+
+def test_merge_parameter_list_repeated_override():
+    first = {"name": "q", "paramType": "query", "description": "first"}
+    second = {"name": "q", "paramType": "query", "description": "second"}
+
+    assert swagger.merge_parameter_list([], [first, second]) == [second]
@@ -0,0 +1,105 @@
+from typing import List, Optional
+
+import pytest
+
+from flask_restful_swagger import swagger
+from tests.fixtures_add_model import patch_registry
+
+try:
+    import dataclasses
+except ImportError:
+    dataclasses = None
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+
+class AnnotatedTodo:
+    def __init__(
+        self,
+        task: str,
+        count: int,
+        tags: List[str],
+        *args,
+        done: bool = False,
+        due: Optional[float] = None,
+        owner="nobody",
+        **kwargs
+    ):
+        pass
+
+
+def test_model_arguments_from_signature():
+    arguments = swagger._model_arguments(AnnotatedTodo)
+
+    assert arguments == [
+        ("task", str, True, swagger._no_default),
+        ("count", int, True, swagger._no_default),
+        ("tags", List[str], True, swagger._no_default),
+        ("done", bool, False, False),
+        ("due", Optional[float], False, None),
+        ("owner", None, False, "nobody"),
+    ]
+
+
+def test_model_arguments_cached():
+    class Cached:
+        def __init__(self, arg1):
+            pass
+
+    first = swagger._model_arguments(Cached)
+    with patch("flask_restful_swagger.swagger.inspect.signature") as sig:
+        assert swagger._model_arguments(Cached) is first
+        assert not sig.called
+
+
+@pytest.mark.skipif(dataclasses is None, reason="requires dataclasses")
+def test_model_arguments_by_class():
+    @dataclasses.dataclass(init=False)
+    class NoInit:
+        x: int = 0
+
+    class Plain:
+        pass
+
+    assert [a[0] for a in swagger._model_arguments(NoInit)] == ["x"]
+    assert swagger._model_arguments(Plain) == []
+
+
+def test_add_model_with_annotations():
+    with patch_registry() as registry:
+        swagger.add_model(AnnotatedTodo)
+
+    model = registry["models"]["AnnotatedTodo"]
+    assert model["required"] == ["task", "count", "tags"]
+    assert model["properties"] == {
+        "task": {"type": "string"},
+        "count": {"type": "integer"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "done": {"type": "boolean", "default": False},
+        "due": {"type": "number", "default": None},
+        "owner": {"type": "string", "default": "nobody"},
+    }
+
+
+@pytest.mark.skipif(dataclasses is None, reason="requires dataclasses")
+def test_add_model_dataclass():
+    @dataclasses.dataclass
+    class TodoData:
+        task: str
+        count: int = 1
+        tags: List[str] = dataclasses.field(default_factory=list)
+        internal: int = dataclasses.field(default=0, init=False)
+
+    with patch_registry() as registry:
+        swagger.add_model(TodoData)
+
+    model = registry["models"]["TodoData"]
+    assert model["required"] == ["task"]
+    assert model["properties"] == {
+        "task": {"type": "string"},
+        "count": {"type": "integer", "default": 1},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    }
@@ -0,0 +1,117 @@
+from flask import Blueprint, Flask
+from flask_restful import Api, Resource, fields
+
+from flask_restful_swagger import swagger
+from flask_restful_swagger.profiling import RegistrationProfiler
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+
+class ProfiledResource(Resource):
+    def get(self):
+        return "OK"
+
+
+def test_registration_profiler_report():
+    profiler = RegistrationProfiler()
+    with profiler.subject("resource", "Fast /fast"):
+        with profiler.phase("parse_doc"):
+            pass
+    with profiler.subject("model", "Slow"):
+        with profiler.phase("deduce_swagger_type"):
+            with profiler.phase("parse_doc"):
+                pass
+    with profiler.phase("outside"):
+        pass
+    profiler.timings[("model", "Slow")]["total"] += 1
+
+    assert sorted(profiler.timings) == [
+        ("model", "Slow"),
+        ("resource", "Fast /fast"),
+    ]
+    assert sorted(profiler.timings[("model", "Slow")]) == [
+        "deduce_swagger_type",
+        "parse_doc",
+        "total",
+    ]
+    lines = profiler.report().splitlines()
+    assert len(lines) == 3
+    assert "model    Slow  (deduce_swagger_type" in lines[1]
+    assert "resource Fast /fast  (parse_doc" in lines[2]
+    assert len(profiler.report(limit=1).splitlines()) == 2
+
+
+@patch("flask_restful_swagger.swagger._path_cache", {})
+def test_docs_profile(capsys):
+    with patch("flask_restful_swagger.swagger.profiler", None):
+        app = Flask(__name__)
+        api = swagger.docs(Api(app), profile=True)
+        assert swagger.profile_report() is not None
+
+        class ProfiledModel(object):
+            resource_fields = {"task": fields.String}
+
+        class MockResource(Resource):
+            @swagger.operation(parameters=[{"name": "body",
+                                            "paramType": "body"}])
+            def get(self, todo_id):
+                return "OK"
+
+        swagger.add_model(ProfiledModel)
+        api.add_resource(MockResource, "/todos/<int:todo_id>")
+
+        timings = swagger.profiler.timings
+        resource = timings[("resource", "MockResource /todos/<int:todo_id>")]
+        assert sorted(resource) == [
+            "extract_operations",
+            "merge_parameter_list",
+            "parse_doc",
+            "parse_path",
+            "total",
+        ]
+        assert resource["parse_path"] > 0
+        assert "deduce_swagger_type" in timings[("model", "ProfiledModel")]
+
+        with app.test_client() as client:
+            client.get("/api/spec.json")
+        assert "MockResource /todos/<int:todo_id>" in capsys.readouterr().err
+
+    assert swagger.profile_report() is None
+
+
+def test_profile_dumped_once_per_app(capsys):
+    with patch("flask_restful_swagger.swagger.profiler", None):
+        app = Flask(__name__)
+        swagger.docs(Api(app), profile=True).add_resource(
+            ProfiledResource, "/app")
+        for name in ["profiled_first", "profiled_second"]:
+            blueprint = Blueprint(name, __name__)
+            swagger.docs(Api(blueprint), profile=True).add_resource(
+                ProfiledResource, "/" + name)
+            app.register_blueprint(blueprint, url_prefix="/" + name)
+
+        with app.test_client() as client:
+            client.get("/app")
+            client.get("/app")
+
+    assert capsys.readouterr().err.count("registration profile") == 1
+
+
+def test_lazy_profile_dumped_once_built(capsys):
+    with patch("flask_restful_swagger.swagger.profiler", None):
+        app = Flask(__name__)
+        api = swagger.docs(Api(app), profile=True, lazy=True)
+        api.add_resource(ProfiledResource, "/lazy")
+
+        with app.test_client() as client:
+            client.get("/lazy")
+            assert capsys.readouterr().err == ""
+            client.get("/api/spec.json")
+            client.get("/api/spec.json")
+
+    err = capsys.readouterr().err
+    assert err.count("registration profile") == 1
+    assert "resource ProfiledResource /lazy" in err
@@ -81,6 +81,10 @@ def test_register_once_blueprint():
             flask_restful_swagger.swagger.ResourceLister,
             "/endpoint/_/resource_list.json",
         ),
+        (
+            flask_restful_swagger.swagger.SpecChanges,
+            "/endpoint/_/changes",
+        ),
         (
             flask_restful_swagger.swagger.StaticFiles,
             "/endpoint/_/static/<string:dir1>/<string:dir2>/<string:dir3>",
@@ -97,6 +101,10 @@ def test_register_once_blueprint():
             flask_restful_swagger.swagger.ResourceLister,
             "/endpoint/_/resource_list.json",
         ),
+        (
+            flask_restful_swagger.swagger.SpecChanges,
+            "/endpoint/_/changes",
+        ),
         (
             flask_restful_swagger.swagger.StaticFiles,
             "/endpoint/_/static/<string:dir1>/<string:dir2>/<string:dir3>",
@@ -108,8 +116,10 @@ def test_register_once_blueprint():
         {},
         {},
         {},
+        {},
         {"endpoint": "app/registry"},
         {"endpoint": "app/resourcelister"},
+        {"endpoint": "app/changes"},
         {"endpoint": "app/staticfiles"},
     ]
 
@@ -141,6 +151,10 @@ def test_register_once_without_blueprint():
             flask_restful_swagger.swagger.ResourceLister,
             "/endpoint/_/resource_list.json",
         ),
+        (
+            flask_restful_swagger.swagger.SpecChanges,
+            "/endpoint/_/changes",
+        ),
         (
             flask_restful_swagger.swagger.StaticFiles,
             "/endpoint/_/static/<string:dir1>/<string:dir2>/<string:dir3>",
@@ -152,6 +166,7 @@ def test_register_once_without_blueprint():
     assert mock_registration.kwargs == [
         {"endpoint": "app/registry"},
         {"endpoint": "app/resourcelister"},
+        {"endpoint": "app/changes"},
         {"endpoint": "app/staticfiles"},
     ]
 
@@ -0,0 +1,94 @@
+import threading
+
+from flask_restful_swagger import LRUCache, Registry, swagger
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+
+def test_registry_publish():
+    registry = Registry(models={})
+    registry.cache["key"] = "value"
+
+    registry.publish("app", {"apis": []})
+
+    assert registry["app"] == {"apis": []}
+    assert registry.generation > 0
+    assert registry.cache == {}
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+
+    cache["c"] = 3
+
+    assert list(cache.keys()) == ["a", "c"]
+    assert cache.get("b") is None
+    cache["a"] = 4
+    assert list(cache.items()) == [("c", 3), ("a", 4)]
+
+
+def test_registry_update_entry_copies_on_write():
+    registry = Registry(models={})
+    registry.publish("app", {"apis": [], "basePath": "http://localhost"})
+    published = registry["app"]
+    generation = registry.generation
+
+    registry.update_entry("app", basePath="http://example.com")
+
+    assert published == {"apis": [], "basePath": "http://localhost"}
+    assert registry["app"] == {"apis": [], "basePath": "http://example.com"}
+    assert registry["app"] is not published
+    assert registry.generation > generation
+
+
+def test_registry_generations_are_shared():
+    first, second = Registry(), Registry()
+
+    first.publish("app", {})
+    second.publish("app", {})
+    first.publish("app", {})
+
+    assert first.generation > second.generation > 0
+
+
+def test_registry_change_log():
+    class SmallRegistry(Registry):
+        change_log_size = 2
+
+    registry = SmallRegistry()
+
+    registry.publish("app", {}, changes=[{"action": "added", "api": 1}])
+    first = registry.generation
+    registry.publish("app", {}, changes=[{"action": "added", "api": 2}])
+    registry.publish("app", {})
+    registry.publish("app", {}, changes=[{"action": "added", "api": 3}])
+
+    assert [c[2]["api"] for c in registry.changes] == [2, 3]
+    assert registry.forgotten == first
+
+
+def test_registry_concurrent_add_model():
+    registry = Registry(models={})
+    classes = [
+        type("Model{0}".format(i), (object,), {"resource_fields": {}})
+        for i in range(50)
+    ]
+
+    with patch("flask_restful_swagger.swagger.registry", registry):
+        threads = [
+            threading.Thread(target=swagger.add_model, args=(c,))
+            for c in classes
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(registry["models"]) == sorted(c.__name__ for c in classes)
+    assert len(registry.changes) == len(classes)
@@ -1,16 +1,18 @@
-from flask import Response
+import datetime
+
+from flask import Flask, Response
+from flask_restful import Api, Resource
 
 from flask_restful_swagger import swagger
 
 try:
-    from unittest.mock import patch, mock_open
+    from unittest.mock import patch
 except ImportError:
-    from mock import patch, mock_open
+    from mock import patch
 
 
 @patch("flask_restful_swagger.swagger._get_current_registry")
-@patch("flask_restful_swagger.swagger.open", new_callable=mock_open)
-def test_render_page(mocked_open, test_reg):
+def test_render_page(test_reg):
     test_reg.return_value = {
         "apiVersion": "mock_version",
         "swaggerVersion": "mock_swagger_version",
@@ -19,13 +21,13 @@ def test_render_page(mocked_open, test_reg):
         "description": "mock_description",
     }
 
-    result = swagger.render_page("docs.html", None)
+    result = swagger.render_page("index.html", None)
     assert isinstance(result, Response)
+    assert b"mock_pathmock_spec_endpoint_path/_/static/" in result.data
 
 
 @patch("flask_restful_swagger.swagger._get_current_registry")
-@patch("flask_restful_swagger.swagger.open", new_callable=mock_open)
-def test_render_page_with_slash(mocked_open, test_reg):
+def test_render_page_with_slash(test_reg):
     test_reg.return_value = {
         "apiVersion": "mock_version",
         "swaggerVersion": "mock_swagger_version",
@@ -35,14 +37,13 @@ def test_render_page_with_slash(mocked_open, test_reg):
     }
 
     result_with_trailing_slash = swagger.render_page(
-        "docs.html", {"some info": "info"}
+        "index.html", {"some info": "info"}
     )
     assert isinstance(result_with_trailing_slash, Response)
 
 
 @patch("flask_restful_swagger.swagger._get_current_registry")
-@patch("flask_restful_swagger.swagger.open", new_callable=mock_open)
-def test_render_page_in_js(mocked_open, test_reg):
+def test_render_page_in_js(test_reg):
     test_reg.return_value = {
         "apiVersion": "mock_version",
         "swaggerVersion": "mock_swagger_version",
@@ -51,8 +52,97 @@ def test_render_page_in_js(mocked_open, test_reg):
         "description": "mock_description",
     }
 
-    result_with_js = swagger.render_page("docs.js", {"some info": "info"})
+    result_with_js = swagger.render_page(
+        "swagger-ui.js", {"some info": "info"}
+    )
     assert (
         result_with_js.headers["Content-Type"]
         == "text/javascript; charset=utf-8"
     )
+
+
+def test_compile_templates():
+    with patch.object(swagger.template_env, "get_template") as get_template:
+        swagger.compile_templates()
+    assert sorted(c[0][0] for c in get_template.call_args_list) == [
+        "endpoint.html",
+        "index.html",
+        "lib/swagger-oauth.js",
+        "o2c.html",
+        "swagger-ui.js",
+        "swagger-ui.min.js",
+    ]
+
+
+def test_render_page_compiles_once():
+    test_reg = {
+        "basePath": "mock_path",
+        "spec_endpoint_path": "mock_spec_endpoint_path",
+    }
+    swagger.compile_templates()
+    with patch(
+        "flask_restful_swagger.swagger._get_current_registry",
+        return_value=test_reg,
+    ), patch.object(swagger.template_env.loader, "get_source") as source:
+        swagger.render_page("endpoint.html", {"path": "/todos"})
+        assert not source.called
+
+
+def test_render_page_cached():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app))
+
+    class MockResource(Resource):
+        def get(self):
+            return "OK"
+
+    api.add_resource(MockResource, "/mock")
+
+    with app.test_client() as client:
+        for url in [
+            "/mock.help.html",
+            "/api/spec.html",
+            "/api/spec/_/static/swagger-ui.js",
+        ]:
+            first = client.get(url)
+            assert first.status_code == 200
+            with patch.object(swagger.template_env, "get_template") as get:
+                second = client.get(url)
+                assert not get.called
+            assert second.data == first.data
+
+        other = client.get("/api/spec.html", base_url="http://example.com")
+        assert b"http://example.com/api/spec/_/static/" in other.data
+
+        api.add_resource(MockResource, "/other", endpoint="other")
+        with patch.object(swagger.template_env, "get_template") as get:
+            client.get("/mock.help.html")
+            assert get.called
+
+
+def test_render_page_with_a_non_json_default():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app))
+
+    class DatedResource(Resource):
+        @swagger.operation(
+            parameters=[
+                {
+                    "name": "since",
+                    "paramType": "query",
+                    "dataType": "date",
+                    "defaultValue": datetime.date(2020, 1, 1),
+                }
+            ]
+        )
+        def get(self):
+            return "OK"
+
+    api.add_resource(DatedResource, "/dated")
+
+    with app.test_client() as client:
+        first = client.get("/dated.help.html")
+        second = client.get("/dated.help.html")
+
+    assert first.status_code == 200
+    assert second.data == first.data
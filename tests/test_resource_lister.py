@@ -1,3 +1,9 @@
+import json
+
+from flask import Flask
+from flask_restful import Api, Resource, fields
+
+from flask_restful_swagger import swagger
 from flask_restful_swagger.swagger import ResourceLister
 
 try:
@@ -29,4 +35,60 @@ def test_get_valid_content_renders(registry, render_page):
         "description": "mock_description",
     }
     resource_lister = ResourceLister()
-    assert resource_lister.get() == expected_result
+    with Flask(__name__).test_request_context():
+        assert resource_lister.get() == expected_result
+
+
+def test_split_resources():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), split_resources=True)
+
+    @swagger.model
+    class SplitTodo(object):
+        resource_fields = {"task": fields.String}
+
+    class Todo(Resource):
+        "Todo items"
+
+        @swagger.operation(responseClass=SplitTodo.__name__)
+        def get(self, todo_id=None):
+            return "OK"
+
+    class Root(Resource):
+        "The root"
+
+        def get(self):
+            return "OK"
+
+    api.add_resource(Todo, "/todos", "/todos/<int:todo_id>")
+    api.add_resource(Root, "/")
+
+    with app.test_client() as client:
+        listing = json.loads(client.get("/api/spec/_/resource_list.json").data)
+        assert listing["apis"] == [
+            {
+                "path": "http://localhost/api/spec/_/resources/_",
+                "description": "The root",
+            },
+            {
+                "path": "http://localhost/api/spec/_/resources/todos",
+                "description": "Todo items",
+            },
+        ]
+
+        todos = json.loads(client.get("/api/spec/_/resources/todos").data)
+        assert todos["resourcePath"] == "/todos"
+        assert todos["basePath"] == "http://localhost"
+        assert [e["path"] for e in todos["apis"]] == [
+            "/todos",
+            "/todos/{todo_id}",
+        ]
+        assert list(todos["models"]) == ["SplitTodo"]
+
+        root = json.loads(client.get("/api/spec/_/resources/_").data)
+        assert root["resourcePath"] == "/"
+        assert [e["path"] for e in root["apis"]] == ["/"]
+        assert root["models"] == {}
+
+        missing = client.get("/api/spec/_/resources/missing")
+        assert missing.status_code == 404
@@ -0,0 +1,135 @@
+"""
+What the ASGI app and the WSGI middleware serving the docs from memory have
+in common, run against both.
+"""
+import json
+
+import pytest
+
+from .fixtures_docs_apps import (
+    HOST,
+    OtherResource,
+    asgi_client,
+    make_app,
+    wsgi_client,
+)
+
+
+@pytest.fixture(params=[asgi_client, wsgi_client], ids=["asgi", "wsgi"])
+def serve(request):
+    return request.param
+
+
+def spec_paths(body):
+    return [api["path"] for api in json.loads(body.decode("utf-8"))["apis"]]
+
+
+def test_serves_the_docs(serve):
+    get = serve(make_app()[0])
+
+    for path in [
+        "/api/spec",
+        "/api/spec.json",
+        "/api/spec.html",
+        "/api/spec/_/resource_list.json",
+        "/api/spec/_/static/index.html",
+        "/todos.help.json",
+        "/todos/{todo_id}.help.html",
+    ]:
+        assert get(path)[0] == 200, path
+
+    status, headers, body = get("/api/spec.json")
+    assert headers["content-type"] == "application/json"
+    assert json.loads(body.decode("utf-8"))["basePath"] == "http://" + HOST
+    assert spec_paths(body) == ["/todos", "/todos/{todo_id}"]
+
+
+def test_head(serve):
+    get = serve(make_app()[0])
+
+    status, headers, body = get("/api/spec/_/static/index.html",
+                                method="HEAD")
+
+    assert status == 200
+    assert int(headers["content-length"]) > 0
+    assert body == b""
+
+
+def test_root_path_is_the_base_url(serve):
+    get = serve(make_app()[0])
+
+    _, _, body = get("/api/spec.json", root_path="/v1")
+
+    spec = json.loads(body.decode("utf-8"))
+    assert spec["basePath"] == "http://" + HOST + "/v1"
+
+
+def test_forwarded_proto(serve):
+    get = serve(make_app()[0])
+
+    plain = get("/api/spec.json")[2]
+    forwarded = get("/api/spec.json", headers={"X-Forwarded-Proto": "https"})
+
+    assert json.loads(plain.decode("utf-8"))["basePath"] == "http://" + HOST
+    spec = json.loads(forwarded[2].decode("utf-8"))
+    assert spec["basePath"] == "https://" + HOST
+
+
+def test_query_string(serve):
+    get = serve(make_app()[0])
+
+    _, _, body = get("/api/spec.json", query_string="path_prefix=/missing")
+
+    assert spec_paths(body) == []
+    assert len(spec_paths(get("/api/spec.json")[2])) == 2
+
+
+def test_if_none_match(serve):
+    get = serve(make_app(etag=True)[0])
+
+    etag = get("/api/spec.json")[1]["etag"]
+    status, headers, body = get("/api/spec.json",
+                                headers={"If-None-Match": etag})
+
+    assert status == 304
+    assert headers["etag"] == etag
+    assert body == b""
+
+
+def test_if_modified_since(serve):
+    get = serve(make_app(static_max_age=3600)[0])
+    url = "/api/spec/_/static/lib/swagger.js"
+
+    last_modified = get(url)[1]["last-modified"]
+    status, headers, body = get(
+        url, headers={"If-Modified-Since": last_modified})
+
+    assert status == 304
+    assert headers["last-modified"] == last_modified
+    assert body == b""
+
+
+def test_new_resources_are_served(serve):
+    app, api = make_app()
+    get = serve(app)
+    get("/api/spec.json")
+
+    api.add_resource(OtherResource, "/other")
+
+    assert "/other" in spec_paths(get("/api/spec.json")[2])
+    assert get("/other.help.json")[0] == 200
+
+
+def test_lazy_specs_are_built_by_doc_requests(serve):
+    app, _ = make_app(lazy=True)
+    reg = app.extensions["flask-restful-swagger"]
+    get = serve(app)
+
+    get("/todos")
+    assert len(reg.pending) == 2
+    assert get.docs_app.documents.serves("/api/spec.json")
+    assert len(reg.pending) == 2
+
+    assert spec_paths(get("/api/spec.json")[2]) == [
+        "/todos", "/todos/{todo_id}"]
+    assert reg.pending == []
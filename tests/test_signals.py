@@ -0,0 +1,85 @@
+from flask import Flask
+from flask.signals import Namespace
+from flask_restful import Api, Resource, fields
+
+from flask_restful_swagger import signals, swagger
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+
+def record(signal):
+    sent = []
+
+    def receiver(sender, **kwargs):
+        sent.append((sender, kwargs))
+
+    signal.connect(receiver, weak=False)
+    return sent, receiver
+
+
+def test_timing_signals():
+    received = {}
+    receivers = []
+    for name in [
+        "api_registered",
+        "endpoint_built",
+        "model_added",
+        "page_rendered",
+        "static_file_served",
+    ]:
+        received[name], receiver = record(getattr(signals, name))
+        receivers.append((getattr(signals, name), receiver))
+
+    try:
+        app = Flask(__name__)
+        api = swagger.docs(Api(app))
+
+        @swagger.model
+        class SignalModel(object):
+            resource_fields = {"task": fields.String}
+
+        class MockResource(Resource):
+            def get(self):
+                return "OK"
+
+        api.add_resource(MockResource, "/mock")
+        api.add_resource(MockResource, "/other", endpoint="other")
+
+        with app.test_client() as client:
+            client.get("/api/spec/_/static/swagger-ui.js")
+            client.get("/api/spec/_/static/swagger-ui.js")
+            client.get("/api/spec/_/static/css/screen.css")
+    finally:
+        for signal, receiver in receivers:
+            signal.disconnect(receiver)
+
+    assert [s for s, _ in received["api_registered"]] == [api]
+    assert received["api_registered"][0][1]["endpoint_path"] == "/api/spec"
+    assert [(s, kw["path"]) for s, kw in received["endpoint_built"]] == [
+        (MockResource, "/mock"),
+        (MockResource, "/other"),
+    ]
+    assert [s for s, _ in received["model_added"]] == [SignalModel]
+    assert [(s, kw["cached"]) for s, kw in received["page_rendered"]] == [
+        ("swagger-ui.js", False),
+        ("swagger-ui.js", True),
+    ]
+    assert [s for s, _ in received["static_file_served"]] == [
+        "swagger-ui.js",
+        "swagger-ui.js",
+        "css/screen.css",
+    ]
+    for sent in received.values():
+        for _, kwargs in sent:
+            assert kwargs["duration"] >= 0
+
+
+def test_timing_signals_without_receivers():
+    signal = Namespace().signal("unused")
+    with patch.object(signal, "send") as send:
+        with swagger._timed(signal, None) as extra:
+            extra["ignored"] = True
+    assert not send.called
@@ -1,8 +1,11 @@
 import os
 
 import pytest
+from flask import Flask
+from flask_restful import Api, Resource
 
 import flask_restful_swagger
+from flask_restful_swagger import swagger
 from flask_restful_swagger.swagger import StaticFiles
 
 try:
@@ -142,3 +145,56 @@ def test_get_valid_content_paths(
     args, kwargs = response.call_args_list[0]
     assert args == ("file_handle",)
     assert kwargs == {"mimetype": "text/plain"}
+
+
+def test_cached_static_files():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), static_max_age=3600)
+
+    class MockResource(Resource):
+        def get(self):
+            return "OK"
+
+    api.add_resource(MockResource, "/mock")
+
+    with app.test_client() as client:
+        with patch("flask_restful_swagger.swagger.open") as mock_open, patch(
+            "flask_restful_swagger.swagger.os.path.exists"
+        ) as mock_exists:
+            response = client.get("/api/spec/_/static/css/screen.css")
+            assert not mock_open.called
+            assert not mock_exists.called
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/css"
+        assert response.cache_control.max_age == 3600
+        assert response.cache_control.public
+        assert response.last_modified is not None
+
+        not_modified = client.get(
+            "/api/spec/_/static/css/screen.css",
+            headers={"If-Modified-Since": response.headers["Last-Modified"]},
+        )
+        assert not_modified.status_code == 304
+
+        missing = client.get("/api/spec/_/static/css/missing.css")
+        assert missing.status_code == 404
+
+
+def test_static_files_loaded_at_once():
+    walk = swagger._walk_static_files
+    seen = []
+
+    def walk_static_files():
+        for file_path, full_path in walk():
+            seen.append(len(swagger._static_files))
+            yield file_path, full_path
+
+    with patch.object(swagger, "_static_files", {}), patch(
+        "flask_restful_swagger.swagger._walk_static_files", walk_static_files
+    ):
+        swagger._load_static_files()
+        loaded = swagger._static_files
+
+    assert seen and set(seen) == {0}
+    assert "css/screen.css" in loaded
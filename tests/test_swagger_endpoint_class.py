@@ -185,3 +185,40 @@ def test_get_swagger_endpoint_subclassed_basic_example(
     )
     mock_properties.update(update_with)
     tc.assertDictEqual(return_value[0], mock_properties)
+
+
+def test_swagger_endpoint_extract_operations_first_in_mro():
+    class Base(Resource):
+        @operation(notes="base")
+        def get(self):
+            return "OK"
+
+    class Mixin(object):
+        @operation(notes="mixin")
+        def get(self):
+            return "OK"
+
+    class Child(Mixin, Base):
+        pass
+
+    operations = SwaggerEndpoint.extract_operations(Child, [])
+    assert [op["notes"] for op in operations] == ["mixin"]
+
+
+def test_swagger_endpoint_extract_operations_memoized():
+    class MockResource(Resource):
+        @operation(
+            parameters=[{"name": "body", "paramType": "body"}],
+        )
+        def get(self):
+            return "OK"
+
+    path_arguments = [{"name": "todo_id", "paramType": "path"}]
+    first = SwaggerEndpoint.extract_operations(MockResource, path_arguments)
+    with patch("flask_restful_swagger.swagger._parse_doc") as parse_doc:
+        second = SwaggerEndpoint.extract_operations(MockResource, [])
+        assert not parse_doc.called
+
+    assert [p["name"] for p in first[0]["parameters"]] == ["todo_id", "body"]
+    assert [p["name"] for p in second[0]["parameters"]] == ["body"]
+    assert first[0] is not second[0]
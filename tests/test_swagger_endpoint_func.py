@@ -2,6 +2,7 @@ from bs4 import BeautifulSoup
 from flask import Flask
 from flask_restful import Resource
 
+from flask_restful_swagger import Registry
 from flask_restful_swagger.swagger import swagger_endpoint
 
 try:
@@ -11,7 +12,11 @@ except ImportError:
 
 
 @patch("flask_restful_swagger.swagger._get_current_registry")
-def test_get_swagger_endpoint(registry):
+@patch("flask_restful_swagger.swagger._api_name")
+@patch("flask_restful_swagger.swagger._api_registry")
+def test_get_swagger_endpoint(api_registry, api_name, registry):
+    api_registry.return_value = shared_registry = Registry()
+    api_name.return_value = "some_api"
     registry.return_value = {
         "apiVersion": "mock_version",
         "swaggerVersion": "mock_swagger_version",
@@ -27,6 +32,9 @@ def test_get_swagger_endpoint(registry):
     app = Flask(__name__)
 
     resource = swagger_endpoint("some_api", MockResource, "/some_path")
+    api_name.assert_called_once_with("some_api")
+    api_registry.assert_called_once_with("some_api")
+    assert shared_registry["some_api"]["apis"][0]["path"] == "/some_path"
     bases = [base.__name__ for base in resource.__mro__]
 
     assert sorted(bases) == [
@@ -1,5 +1,12 @@
+import datetime
+import gzip
+import io
+import json
+
 from flask import Flask
+from flask_restful import Api, Resource, fields
 
+from flask_restful_swagger import swagger
 from flask_restful_swagger.swagger import SwaggerRegistry
 
 try:
@@ -47,3 +54,239 @@ def test_get_swagger_registry(homepage, registry):
         response = resource.get()
         assert not homepage.called
         assert response == mock_registry
+
+
+def test_get_swagger_registry_cached_spec():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), cache_spec=True)
+
+    class MockResource(Resource):
+        def get(self):
+            return "OK"
+
+    api.add_resource(MockResource, "/mock")
+
+    with app.test_client() as client:
+        first = client.get("/api/spec.json")
+        assert first.status_code == 200
+        assert first.mimetype == "application/json"
+        assert json.loads(first.data)["apis"][0]["path"] == "/mock"
+
+        with patch("flask_restful_swagger.swagger._encode_spec") as encode:
+            second = client.get("/api/spec.json")
+            assert not encode.called
+        assert second.data == first.data
+
+        api.add_resource(MockResource, "/other", endpoint="other")
+        third = client.get("/api/spec.json")
+        paths = [e["path"] for e in json.loads(third.data)["apis"]]
+        assert paths == ["/mock", "/other"]
+
+
+def test_get_swagger_registry_etag():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), etag=True)
+
+    class MockResource(Resource):
+        def get(self):
+            return "OK"
+
+    api.add_resource(MockResource, "/mock")
+
+    with app.test_client() as client:
+        for url in [
+            "/api/spec.json",
+            "/api/spec/_/resource_list.json",
+            "/mock.help.json",
+        ]:
+            first = client.get(url)
+            etag = first.headers["ETag"]
+            assert first.status_code == 200
+            assert not etag.startswith("W/")
+
+            with patch("flask_restful_swagger.swagger._encode_spec") as enc:
+                second = client.get(url, headers={"If-None-Match": etag})
+                assert not enc.called
+            assert second.status_code == 304
+            assert second.data == b""
+
+        spec_etag = client.get("/api/spec.json").headers["ETag"]
+        api.add_resource(MockResource, "/other", endpoint="other")
+        changed = client.get(
+            "/api/spec.json", headers={"If-None-Match": spec_etag}
+        )
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != spec_etag
+
+
+def test_get_swagger_registry_etag_json_settings():
+    app = Flask(__name__)
+    app.config["RESTFUL_JSON"] = {"default": str}
+    api = swagger.docs(Api(app), etag=True)
+
+    class DatedResource(Resource):
+        @swagger.operation(
+            parameters=[{"name": "since", "defaultValue": datetime.date(
+                2020, 1, 1)}]
+        )
+        def get(self):
+            return "OK"
+
+    api.add_resource(DatedResource, "/dated")
+
+    with app.test_client() as client:
+        for url in ["/api/spec.json", "/dated.help.json"]:
+            response = client.get(url)
+            assert response.status_code == 200
+            assert b"2020-01-01" in response.data
+            assert response.headers["ETag"]
+
+
+def test_get_swagger_registry_compressed():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), etag=True, compress=True)
+
+    class MockResource(Resource):
+        def get(self):
+            return "OK"
+
+    api.add_resource(MockResource, "/mock")
+
+    with app.test_client() as client:
+        plain = client.get("/api/spec.json")
+        assert "Content-Encoding" not in plain.headers
+        assert plain.headers["Vary"] == "Accept-Encoding"
+
+        headers = {"Accept-Encoding": "gzip"}
+        zipped = client.get("/api/spec.json", headers=headers)
+        assert zipped.headers["Content-Encoding"] == "gzip"
+        assert gzip.GzipFile(fileobj=io.BytesIO(zipped.data)).read() == (
+            plain.data
+        )
+        assert zipped.headers["ETag"] != plain.headers["ETag"]
+
+        with patch("flask_restful_swagger.swagger._compress") as compress:
+            again = client.get("/api/spec.json", headers=headers)
+            assert not compress.called
+        assert again.data == zipped.data
+
+        headers["If-None-Match"] = zipped.headers["ETag"]
+        assert client.get("/api/spec.json", headers=headers).status_code == (
+            304
+        )
+
+
+def test_get_swagger_registry_per_app():
+    def create_app(url):
+        app = Flask(__name__)
+        api = swagger.docs(Api(app))
+
+        class MockResource(Resource):
+            def get(self):
+                return "OK"
+
+        api.add_resource(MockResource, url)
+        return app
+
+    global_entry = swagger.registry.get("app")
+    first, second = create_app("/first"), create_app("/second")
+
+    for app, url in [(first, "/first"), (second, "/second")]:
+        with app.test_client() as client:
+            spec = json.loads(client.get("/api/spec.json").data)
+            assert [e["path"] for e in spec["apis"]] == [url]
+        assert url == app.extensions["flask-restful-swagger"]["app"][
+            "apis"
+        ][0]["path"]
+
+    assert swagger.registry.get("app") is global_entry
+
+
+def test_get_swagger_registry_filtered():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app), cache_spec=True)
+
+    @swagger.model
+    class FilteredTodo(object):
+        resource_fields = {"task": fields.String}
+
+    class Todo(Resource):
+        @swagger.operation(responseClass=FilteredTodo.__name__,
+                           tags=["todos"])
+        def get(self):
+            return "OK"
+
+    class Billing(Resource):
+        @swagger.operation(tags=["billing"])
+        def get(self):
+            return "OK"
+
+    api.add_resource(Todo, "/todos", "/todos/<int:todo_id>")
+    api.add_resource(Billing, "/todos_billing")
+
+    def paths(query):
+        spec = json.loads(client.get("/api/spec.json" + query).data)
+        return [e["path"] for e in spec["apis"]], sorted(spec["models"])
+
+    with app.test_client() as client:
+        assert paths("?path_prefix=/todos") == (
+            ["/todos", "/todos/{todo_id}"],
+            ["FilteredTodo"],
+        )
+        assert paths("?tag=billing") == (["/todos_billing"], [])
+        assert paths("?path_prefix=/todos&tag=billing") == ([], [])
+        assert paths("?path_prefix=/missing") == ([], [])
+
+        with patch("flask_restful_swagger.swagger.referenced_models") as ref:
+            assert paths("?path_prefix=/todos")[0] == [
+                "/todos",
+                "/todos/{todo_id}",
+            ]
+            assert not ref.called
+
+        full = json.loads(client.get("/api/spec.json").data)
+        assert len(full["apis"]) == 3
+        assert "FilteredTodo" in full["models"]
+
+
+def test_get_swagger_registry_changes():
+    app = Flask(__name__)
+    api = swagger.docs(Api(app))
+
+    class MockResource(Resource):
+        def get(self):
+            return "OK"
+
+    api.add_resource(MockResource, "/mock")
+
+    with app.test_client() as client:
+        spec = client.get("/api/spec.json")
+        generation = int(spec.headers["X-Spec-Generation"])
+
+        nothing = json.loads(
+            client.get("/api/spec/_/changes?since=%d" % generation).data
+        )
+        assert nothing == {"generation": generation, "changes": []}
+
+        @swagger.model
+        class ChangedModel(object):
+            resource_fields = {"task": fields.String}
+
+        api.add_resource(MockResource, "/other", endpoint="other")
+
+        changes = json.loads(
+            client.get("/api/spec/_/changes?since=%d" % generation).data
+        )
+        assert changes["generation"] > generation
+        added = changes["changes"]
+        assert [c["action"] for c in added] == ["added", "added"]
+        assert added[0]["model"]["id"] == "ChangedModel"
+        assert added[1]["api"]["path"] == "/other"
+        assert added[0]["generation"] < added[1]["generation"]
+        assert changes["generation"] == int(
+            client.get("/api/spec.json").headers["X-Spec-Generation"]
+        )
+
+        app.extensions["flask-restful-swagger"].forgotten = generation + 1
+        gone = client.get("/api/spec/_/changes?since=%d" % generation)
+        assert gone.status_code == 410
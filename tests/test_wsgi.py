@@ -0,0 +1,40 @@
+from .fixtures_docs_apps import make_app, wsgi_client
+
+
+def make_counted_app(**kwargs):
+    # An app behind the middleware, counting the requests flask handles
+    app, _ = make_app(**kwargs)
+    app.requests = []
+    app.before_request(lambda: app.requests.append(1))
+    return app, wsgi_client(app)
+
+
+def test_serves_from_memory():
+    app, get = make_counted_app()
+
+    first = get("/api/spec.json")
+    for _ in range(3):
+        assert get("/api/spec.json") == first
+
+    # Only the first request went through flask, to render the spec
+    assert len(app.requests) == 1
+
+
+def test_prefix_check():
+    _, get = make_counted_app()
+    documents = get.docs_app.documents
+
+    assert documents.serves("/api/spec")
+    assert documents.serves("/api/spec/_/static/swagger-ui.js")
+    assert documents.serves("/todos/{todo_id}.help.json")
+    assert not documents.serves("/todos/1")
+
+
+def test_other_requests_go_to_the_app():
+    app, get = make_counted_app()
+
+    assert get("/todos/1")[0] == 200
+    assert get("/api/spec.json", method="POST")[0] == 405
+    assert get("/api/spec/_/static/missing.js")[0] == 404
+
+    assert len(app.requests) == 3